@@ -1,7 +1,10 @@
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
-from typing import List
+from fastapi.responses import ORJSONResponse
+from typing import Awaitable, Callable, Dict, List
+from urllib.parse import urlparse
+import asyncio
 import logging
+import re
 
 from ...schemas.match import (
     ScrapingRequest, 
@@ -11,17 +14,140 @@ from ...schemas.match import (
 )
 from ...services.match_parser import MatchParser
 from ...services.selenium_parser import SeleniumMatchParser
+from ...services.tracker_api import TrackerApiClient
+from ...services.cache import MatchCache
+from ...services.rate_limiter import RateLimiter
 from ...core.config import settings
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Accepted match URLs and IDs
+_MATCH_URL_RE = re.compile(r'^https://tracker\.gg/valorant/match/[A-Za-z0-9-]{8,}(?:\?.*)?$')
+_MATCH_ID_RE = re.compile(r'^[A-Za-z0-9-]{8,}$')
+
 # Create router
 router = APIRouter(prefix="/v1", tags=["valorant-matches"])
 
 # Initialize match parsers
 match_parser = MatchParser()
 selenium_parser = SeleniumMatchParser()
+tracker_api = TrackerApiClient()
+
+# Initialize response cache
+match_cache = MatchCache()
+
+# Bound concurrent outgoing requests per host so batches don't hammer it
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+# Per-host rate limiters for Selenium scrapes, so fallbacks can't flood a host
+_rate_limiters: Dict[str, RateLimiter] = {}
+
+# Scrapes currently running, keyed by cache key, so duplicate requests share one
+_inflight: Dict[str, "asyncio.Task[ScrapingResponse]"] = {}
+
+
+async def _scrape_with_limit(url: str) -> ScrapingResponse:
+    """Scrape a match while holding its host's semaphore, never raising"""
+    # Only tracker.gg match pages may reach the parsers and the pooled browsers
+    if not _MATCH_URL_RE.match(url):
+        return ScrapingResponse(
+            success=False,
+            error_message="Invalid URL. Only tracker.gg/valorant match URLs are supported.",
+            processing_time=0.0
+        )
+    
+    host = urlparse(url).hostname or ""
+    semaphore = _host_semaphores.setdefault(
+        host, asyncio.Semaphore(settings.max_concurrent_per_host)
+    )
+    async with semaphore:
+        try:
+            return await match_parser.scrape_match(url)
+        except Exception as e:
+            logger.warning(f"Failed to scrape {url}: {str(e)}")
+            return ScrapingResponse(
+                success=False,
+                error_message=str(e),
+                processing_time=0.0
+            )
+
+
+async def _cached_scrape(
+    key: str,
+    scrape: Callable[[], Awaitable[ScrapingResponse]]
+) -> ScrapingResponse:
+    """Return the cached response for a key, scraping and caching on a miss"""
+    cached = await match_cache.get(key)
+    if cached is not None:
+        logger.info(f"Cache hit for {key}")
+        return cached
+    
+    # Join a scrape already running for this key instead of starting another.
+    # There is no await between the lookup and the insert, so this can't race.
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_scrape_and_cache(key, scrape))
+        _inflight[key] = task
+    else:
+        logger.info(f"Joining in-flight scrape for {key}")
+    
+    # Shield the shared scrape from cancellation by any single waiter
+    return await asyncio.shield(task)
+
+
+async def _scrape_and_cache(
+    key: str,
+    scrape: Callable[[], Awaitable[ScrapingResponse]]
+) -> ScrapingResponse:
+    """Scrape, cache the result and clear the in-flight entry"""
+    try:
+        response = await scrape()
+        if not response.success:
+            # Finished matches don't change, so an expired copy beats an error
+            stale = await match_cache.get_stale(key)
+            if stale is not None:
+                logger.info(f"Serving stale cache entry for {key}")
+                return stale
+        
+        await match_cache.set(key, response)
+        return response
+    finally:
+        _inflight.pop(key, None)
+
+
+def _get_rate_limiter(url: str) -> RateLimiter:
+    """Return the rate limiter for a URL's host"""
+    host = urlparse(url).hostname or ""
+    limiter = _rate_limiters.get(host)
+    if limiter is None:
+        limiter = _rate_limiters[host] = RateLimiter(settings.selenium_requests_per_second)
+    return limiter
+
+
+async def _scrape_with_selenium(url: str) -> ScrapingResponse:
+    """Scrape a match with Selenium once its host's rate limiter allows"""
+    await _get_rate_limiter(url).acquire()
+    return await selenium_parser.scrape_match(url)
+
+
+async def _scrape_with_fallback(match_url: str) -> ScrapingResponse:
+    """Fetch from the tracker.gg API, falling back to Selenium and then the requests parser"""
+    # The JSON API skips the browser entirely when it isn't blocked
+    response = await tracker_api.scrape_match(match_url)
+    if response.success:
+        return response
+    
+    # Try Selenium parser next (more reliable for tracker.gg pages)
+    logger.info("Tracker API failed, trying Selenium parser...")
+    response = await _scrape_with_selenium(match_url)
+    
+    # If Selenium fails, fall back to requests parser
+    if not response.success:
+        logger.info("Selenium parser failed, trying requests parser...")
+        response = await match_parser.scrape_match(match_url)
+    
+    return response
 
 
 @router.get("/health")
@@ -39,23 +165,20 @@ async def scrape_match(request: ScrapingRequest):
     """
     Scrape match data from a tracker.gg URL
     """
+    # Validate URL
+    if not _MATCH_URL_RE.match(request.match_url):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid URL. Only tracker.gg/valorant match URLs are supported."
+        )
+    
     try:
         logger.info(f"Received scrape request for URL: {request.match_url}")
         
-        # Validate URL
-        if not request.match_url.startswith("https://tracker.gg/valorant"):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid URL. Only tracker.gg/valorant URLs are supported."
-            )
-        
-        # Try Selenium parser first (more reliable for tracker.gg)
-        response = selenium_parser.scrape_match(request.match_url)
-        
-        # If Selenium fails, fall back to requests parser
-        if not response.success:
-            logger.info("Selenium parser failed, trying requests parser...")
-            response = match_parser.scrape_match(request.match_url)
+        response = await _cached_scrape(
+            MatchCache.url_key(request.match_url),
+            lambda: _scrape_with_fallback(request.match_url)
+        )
         
         if not response.success:
             raise HTTPException(
@@ -81,6 +204,13 @@ async def scrape_match_by_id(match_id: str):
     """
     Scrape match data by match ID
     """
+    # Validate match ID
+    if not _MATCH_ID_RE.match(match_id):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid match ID."
+        )
+    
     try:
         # Construct URL from match ID
         match_url = f"https://tracker.gg/valorant/match/{match_id}"
@@ -88,7 +218,10 @@ async def scrape_match_by_id(match_id: str):
         logger.info(f"Scraping match by ID: {match_id}")
         
         # Scrape the match
-        response = match_parser.scrape_match(match_url)
+        response = await _cached_scrape(
+            MatchCache.id_key(match_id),
+            lambda: match_parser.scrape_match(match_url)
+        )
         
         if not response.success:
             raise HTTPException(
@@ -139,11 +272,12 @@ async def get_scraping_stats():
         "base_url": settings.base_url,
         "max_retries": settings.max_retries,
         "request_timeout": settings.request_timeout,
-        "delay_between_requests": settings.delay_between_requests
+        "delay_between_requests": settings.delay_between_requests,
+        "max_concurrent_per_host": settings.max_concurrent_per_host
     }
 
 
-@router.post("/batch-scrape")
+@router.post("/batch-scrape", response_model=None)
 async def batch_scrape_matches(urls: List[str]):
     """
     Scrape multiple matches in batch
@@ -155,25 +289,26 @@ async def batch_scrape_matches(urls: List[str]):
                 detail="Batch size too large. Maximum 10 URLs allowed."
             )
         
-        results = []
-        for url in urls:
-            try:
-                response = match_parser.scrape_match(url)
-                results.append(response)
-            except Exception as e:
-                logger.warning(f"Failed to scrape {url}: {str(e)}")
-                results.append(ScrapingResponse(
-                    success=False,
-                    error_message=str(e),
-                    processing_time=0.0
-                ))
+        # Scrape all URLs concurrently
+        results = await asyncio.gather(*(_scrape_with_limit(url) for url in urls))
+        
+        # Retry failures with Selenium, each scrape waiting on its own host's rate limiter
+        failed = [i for i, r in enumerate(results) if not r.success and _MATCH_URL_RE.match(urls[i])]
+        if failed:
+            logger.info(f"Retrying {len(failed)} failed URLs with Selenium parser...")
+            retried = await asyncio.gather(*(_scrape_with_selenium(urls[i]) for i in failed))
+            for i, response in zip(failed, retried):
+                if response.success:
+                    results[i] = response
         
-        return {
+        # Dump each result once and hand the plain payload straight to orjson
+        successful = sum(1 for r in results if r.success)
+        return ORJSONResponse({
             "total_requests": len(urls),
-            "successful": sum(1 for r in results if r.success),
-            "failed": sum(1 for r in results if not r.success),
-            "results": results
-        }
+            "successful": successful,
+            "failed": len(results) - successful,
+            "results": [r.model_dump(mode='json') for r in results]
+        })
         
     except HTTPException:
         raise
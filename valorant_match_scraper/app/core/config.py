@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -12,13 +13,32 @@ class Settings(BaseSettings):
     
     # Scraping Settings
     base_url: str = "https://tracker.gg/valorant"
+    tracker_api_url: str = "https://api.tracker.gg/api/v2/valorant/standard/matches"
     request_timeout: int = 30
     max_retries: int = 3
-    delay_between_requests: float = 1.0
+    delay_between_requests: float = 1.0  # Base delay for exponential retry backoff
+    retry_backoff_cap: float = 30.0
+    retry_jitter: float = 1.0
+    max_concurrent_per_host: int = 5
+    max_keepalive_connections: int = 32
+    keepalive_expiry: float = 60.0
+    
+    # Selenium Settings
+    selenium_pool_size: Optional[int] = None  # Defaults to the CPU count
+    chromedriver_path: Optional[str] = None  # Resolved by Selenium Manager when unset
+    clean_sessions: bool = False  # Recreate drivers after max_driver_uses scrapes
+    max_driver_uses: int = 50
+    clear_cookies_every: int = 0  # Clear a driver's cookies every N scrapes (0 disables)
+    selenium_requests_per_second: float = 2.0  # Per-host rate limit (0 disables)
     
     # Database Settings (if needed)
     database_url: Optional[str] = None
     
+    # Cache Settings (caching is disabled when redis_url is unset)
+    redis_url: Optional[str] = None
+    cache_ttl: int = 86400
+    cache_stale_ttl: int = 604800
+    
     # Logging
     log_level: str = "INFO"
     
@@ -27,5 +47,11 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """Return the cached application settings"""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -1,11 +1,13 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import os
 import time
 
 from .core.config import settings
-from .api.v1.endpoints import router as api_router
+from .api.v1.endpoints import router as api_router, match_parser, selenium_parser, tracker_api, match_cache
 
 # Configure logging
 logging.basicConfig(
@@ -20,7 +22,8 @@ app = FastAPI(
     version=settings.api_version,
     description=settings.api_description,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -35,28 +38,12 @@ app.add_middleware(
 
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    """Add processing time header to responses"""
-    start_time = time.time()
+    """Add processing time header to responses and log the request"""
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     response.headers["X-Process-Time"] = str(process_time)
-    return response
-
-
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming requests"""
-    start_time = time.time()
-    
-    # Log request
-    logger.info(f"Request: {request.method} {request.url}")
-    
-    response = await call_next(request)
-    
-    # Log response
-    process_time = time.time() - start_time
-    logger.info(f"Response: {response.status_code} - {process_time:.3f}s")
-    
+    logger.info(f"{request.method} {request.url.path} {response.status_code} {process_time:.3f}s")
     return response
 
 
@@ -64,7 +51,7 @@ async def log_requests(request: Request, call_next):
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler"""
     logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -77,6 +64,14 @@ async def global_exception_handler(request: Request, exc: Exception):
 async def startup_event():
     """Application startup event"""
     logger.info(f"Starting {settings.api_title} v{settings.api_version}")
+    await match_parser.startup()
+    await tracker_api.startup()
+    
+    # Parse HTML in worker processes so it doesn't block the event loop
+    app.state.pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    match_parser.executor = app.state.pool
+    await match_cache.startup()
+    await selenium_parser.startup()
     logger.info(f"API Documentation available at: /docs")
 
 
@@ -84,6 +79,12 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event"""
     logger.info("Shutting down Valorant Match Scraper API")
+    await match_parser.close()
+    await tracker_api.close()
+    await match_cache.close()
+    selenium_parser.close()
+    match_parser.executor = None
+    app.state.pool.shutdown()
 
 
 # Include API routes
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime
 from enum import Enum
@@ -29,6 +29,8 @@ class MapName(str, Enum):
 
 class PlayerPerformance(BaseModel):
     """Player performance in a match"""
+    model_config = ConfigDict(frozen=True)
+    
     player_name: str = Field(..., description="Player's display name")
     team: str = Field(..., description="Team (Red/Blue)")
     kills: int = Field(..., description="Number of kills")
@@ -0,0 +1,78 @@
+import hashlib
+import logging
+from typing import Optional
+
+import orjson
+import redis.asyncio as redis
+
+from ..core.config import settings
+from ..schemas.match import ScrapingResponse
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class MatchCache:
+    """Redis-backed cache for scraped match responses"""
+
+    def __init__(self):
+        self.client: Optional[redis.Redis] = None
+
+    async def startup(self):
+        """Connect to Redis if a URL is configured"""
+        if self.client is None and settings.redis_url:
+            self.client = redis.from_url(settings.redis_url)
+            logger.info("Match cache enabled")
+
+    async def close(self):
+        """Close the Redis connection"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    @staticmethod
+    def url_key(match_url: str) -> str:
+        """Build the cache key for a match URL"""
+        return f"match:{hashlib.sha1(match_url.encode()).hexdigest()}"
+
+    @staticmethod
+    def id_key(match_id: str) -> str:
+        """Build the cache key for a match ID"""
+        return f"match:id:{match_id}"
+    
+    @staticmethod
+    def stale_key(key: str) -> str:
+        """Build the key of the long-lived copy kept for a cache key"""
+        return f"stale:{key}"
+
+    async def get(self, key: str) -> Optional[ScrapingResponse]:
+        """Return the cached response for a key, if any"""
+        if self.client is None:
+            return None
+
+        try:
+            cached = await self.client.get(key)
+            if cached:
+                # pydantic's own JSON validation beats orjson.loads + model_validate here
+                return ScrapingResponse.model_validate_json(cached)
+        except Exception as e:
+            logger.warning(f"Cache lookup failed for {key}: {str(e)}")
+        return None
+
+    async def get_stale(self, key: str) -> Optional[ScrapingResponse]:
+        """Return the last successful response for a key, even if it has expired"""
+        return await self.get(self.stale_key(key))
+
+    async def set(self, key: str, response: ScrapingResponse):
+        """Store a successful response under a key, plus a long-lived stale copy"""
+        if self.client is None or not response.success:
+            return
+
+        try:
+            payload = orjson.dumps(response.model_dump())
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(key, payload, ex=settings.cache_ttl)
+                pipe.set(self.stale_key(key), payload, ex=settings.cache_stale_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Cache store failed for {key}: {str(e)}")
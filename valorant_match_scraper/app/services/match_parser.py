@@ -1,39 +1,193 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import httpx
+from lxml import etree
+from concurrent.futures import Executor
+import random
 import time
 import logging
 from typing import Optional, Dict, Any
 from datetime import datetime
 import re
 
-from ..core.config import settings
+from ..core.config import Settings, settings
 from ..schemas.match import MatchResult, PlayerPerformance, GameMode, MapName, ScrapingResponse
 
 # Configure logging
 logging.basicConfig(level=getattr(logging, settings.log_level))
 logger = logging.getLogger(__name__)
 
+# Browser-like headers sent with every request
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0'
+}
+
+# Date and duration formats found on match pages
+_DATE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y")
+_DURATION_RE = re.compile(r'(?:(\d+):)?(\d+):(\d+)')
+
+# Keyword -> enum lookups for classifying page text, checked in order
+_MODE_KEYWORDS = {
+    'deathmatch': GameMode.DEATHMATCH,
+    'unrated': GameMode.UNRATED,
+    'competitive': GameMode.COMPETITIVE,
+}
+_MAP_LOOKUP = {m.value: m for m in MapName}
+
+# Streaming stops at the closing body tag; pages without a player marker aren't parsed
+_BODY_END = b'</body>'
+_PLAYER_MARKERS = (b'player-stats', b'player-table')
+
+# Status codes worth retrying; any other 4xx fails immediately
+RETRY_STATUS_CODES = {429}
+
+
+# Match-level fields, read from the first div carrying each class
+_MATCH_INFO_CLASSES = frozenset(('game-mode', 'map-name', 'score', 'duration', 'match-date'))
+
+
+class _MatchTarget:
+    """lxml parser target that streams match fields out of a page without building a tree
+    
+    Only the text of elements we read is kept: match-level divs, the divs
+    inside each player-stats container and the cells of player-table rows.
+    """
+    
+    def __init__(self):
+        self.fields: Dict[str, list] = {}  # class -> texts of match-level divs
+        self.players: list[Dict[str, Any]] = []  # class -> text of first div, per player
+        self.tables: list[list[list]] = []  # rows of cell texts, per player table
+        self._open_players: list[Dict[str, Any]] = []  # players whose containers are open, outermost first
+        self._table: Optional[list] = None
+        self._row: Optional[list] = None
+        self._active: list[list[str]] = []  # text buffers of open captured elements
+        self._stack: list[tuple] = []  # (buffers opened, container closed) per open element
+    
+    def _capture(self) -> list[str]:
+        """Start collecting text for the element being opened"""
+        buffer: list[str] = []
+        self._active.append(buffer)
+        return buffer
+    
+    def start(self, tag: str, attrib: Dict[str, str]):
+        active_before = len(self._active)
+        container = None
+        classes = attrib.get('class', '').split()
+        
+        if tag == 'div':
+            for class_name in classes:
+                if class_name in _MATCH_INFO_CLASSES:
+                    self.fields.setdefault(class_name, []).append(self._capture())
+                # Every open container reads its first div of each class, even inside a nested one
+                buffer = None
+                for player in self._open_players:
+                    if class_name not in player:
+                        if buffer is None:
+                            buffer = self._capture()
+                        player[class_name] = buffer
+            if 'player-stats' in classes:
+                player = {}
+                self._open_players.append(player)
+                self.players.append(player)
+                container = 'player'
+        elif tag == 'table' and 'player-table' in classes and self._table is None:
+            self._table = []
+            self.tables.append(self._table)
+            container = 'table'
+        elif tag == 'tr' and self._table is not None and self._row is None:
+            self._row = []
+            self._table.append(self._row)
+            container = 'row'
+        elif tag == 'td' and self._row is not None:
+            self._row.append(self._capture())
+        
+        self._stack.append((len(self._active) - active_before, container))
+    
+    def end(self, tag: str):
+        if not self._stack:
+            return
+        opened, container = self._stack.pop()
+        if opened:
+            del self._active[-opened:]
+        if container == 'player':
+            self._open_players.pop()
+        elif container == 'table':
+            self._table = None
+        elif container == 'row':
+            self._row = None
+    
+    def data(self, data: str):
+        for buffer in self._active:
+            buffer.append(data)
+    
+    def close(self) -> '_MatchTarget':
+        # Collapse the collected text buffers into stripped strings
+        self.fields = {
+            class_name: [_join_text(buffer) for buffer in buffers]
+            for class_name, buffers in self.fields.items()
+        }
+        self.players = [
+            {class_name: _join_text(buffer) for class_name, buffer in player.items()}
+            for player in self.players
+        ]
+        self.tables = [
+            [[_join_text(cell) for cell in row] for row in table]
+            for table in self.tables
+        ]
+        return self
+
+
+def _join_text(buffer: list[str]) -> str:
+    """Join a captured text buffer the way text_content().strip() would"""
+    return ''.join(buffer).strip()
+
 
 class MatchParser:
     """Service for parsing Valorant match data from tracker.gg"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        })
+    def __init__(self, config: Optional[Settings] = None):
+        config = config or settings
+        self.config = config
+        # Bind hot-path settings once instead of reading them per retry
+        self._timeout = config.request_timeout
+        self._retries = config.max_retries
+        self._delay = config.delay_between_requests
+        self._backoff_cap = config.retry_backoff_cap
+        self._jitter = config.retry_jitter
+        self.client: Optional[httpx.AsyncClient] = None
+        # Process pool for HTML parsing; parsing runs inline when unset
+        self.executor: Optional[Executor] = None
+    
+    async def startup(self):
+        """Create the shared async HTTP client"""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                http2=True,
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry
+                ),
+                follow_redirects=True
+            )
     
-    def scrape_match(self, match_url: str) -> ScrapingResponse:
+    async def close(self):
+        """Close the shared async HTTP client"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    async def scrape_match(self, match_url: str) -> ScrapingResponse:
         """Scrape match data from a tracker.gg URL"""
         start_time = time.time()
         
@@ -41,33 +195,49 @@ class MatchParser:
             logger.info(f"Starting to scrape match: {match_url}")
             
             # Fetch the page
-            response = self._make_request(match_url)
-            if not response:
+            content = await self._make_request(match_url)
+            if content is None:
                 return ScrapingResponse(
                     success=False,
                     error_message="Failed to fetch match page",
                     processing_time=time.time() - start_time
                 )
             
-            # Parse the HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Skip parsing pages without player data (e.g. JS-rendered shells)
+            if not any(marker in content for marker in _PLAYER_MARKERS):
+                return ScrapingResponse(
+                    success=False,
+                    error_message="No player data markers found in match page",
+                    processing_time=time.time() - start_time
+                )
             
-            # Extract match data
-            match_data = self._parse_match_data(soup, match_url)
+            # Parse the HTML off the event loop
+            if self.executor is not None:
+                loop = asyncio.get_running_loop()
+                match_dict = await loop.run_in_executor(
+                    self.executor, parse_match_bytes, content, match_url
+                )
+            else:
+                match_dict = parse_match_bytes(content, match_url)
             
-            if not match_data:
+            if not match_dict:
                 return ScrapingResponse(
                     success=False,
                     error_message="Failed to parse match data",
                     processing_time=time.time() - start_time
                 )
             
+            # Player rows are built with the right types by the parser, so skip validation
+            match_dict['players'] = [
+                PlayerPerformance.model_construct(**player) for player in match_dict['players']
+            ]
+            
             processing_time = time.time() - start_time
             logger.info(f"Successfully scraped match in {processing_time:.2f}s")
             
             return ScrapingResponse(
                 success=True,
-                match_data=match_data,
+                match_data=MatchResult(**match_dict),
                 processing_time=processing_time
             )
             
@@ -79,299 +249,323 @@ class MatchParser:
                 processing_time=time.time() - start_time
             )
     
-    def _make_request(self, url: str) -> Optional[requests.Response]:
-        """Make HTTP request with retry logic"""
-        for attempt in range(settings.max_retries):
+    async def _make_request(self, url: str) -> Optional[bytes]:
+        """Fetch a page body with retry logic"""
+        # Create the client lazily when used outside the app lifecycle
+        await self.startup()
+        
+        for attempt in range(self._retries):
+            # Back off before retrying to avoid rate limiting
+            if attempt > 0:
+                await asyncio.sleep(self._backoff_delay(attempt - 1))
+            
             try:
-                # Add a small delay before each request to avoid rate limiting
-                if attempt > 0:
-                    time.sleep(settings.delay_between_requests * (attempt + 1))
-                
-                response = self.session.get(url, timeout=settings.request_timeout)
-                response.raise_for_status()
-                return response
-            except requests.RequestException as e:
+                async with self.client.stream('GET', url) as response:
+                    if response.status_code in RETRY_STATUS_CODES or response.is_server_error:
+                        logger.warning(f"Request attempt {attempt + 1} failed: HTTP {response.status_code}")
+                        continue
+                    
+                    if response.is_error:
+                        logger.error(f"Request for {url} failed: HTTP {response.status_code}")
+                        return None
+                    
+                    return await self._read_body(response)
+            except httpx.TransportError as e:
                 logger.warning(f"Request attempt {attempt + 1} failed: {str(e)}")
-                if attempt < settings.max_retries - 1:
-                    time.sleep(settings.delay_between_requests)
-                else:
-                    logger.error(f"All request attempts failed for {url}")
-                    return None
+        
+        logger.error(f"All request attempts failed for {url}")
+        return None
     
-    def _parse_match_data(self, soup: BeautifulSoup, match_url: str) -> Optional[MatchResult]:
-        """Parse match data from BeautifulSoup object"""
-        try:
-            # Extract basic match info
-            match_info = self._extract_match_info(soup)
-            if not match_info:
-                return None
-            
-            # Extract player data
-            players = self._extract_player_data(soup)
-            if not players:
-                logger.warning("No player data found")
-                return None
-            
-            # Create match result
-            match_result = MatchResult(
-                match_id=match_info.get('match_id', 'unknown'),
-                match_url=match_url,
-                game_mode=match_info.get('game_mode', GameMode.DEATHMATCH),
-                map_name=match_info.get('map_name', MapName.ASCENT),
-                match_duration=match_info.get('duration', 0),
-                match_date=match_info.get('date', datetime.now()),
-                red_team_score=match_info.get('red_score', 0),
-                blue_team_score=match_info.get('blue_score', 0),
-                winner=match_info.get('winner', 'Unknown'),
-                players=players,
-                total_rounds=match_info.get('total_rounds', 0),
-                overtime_rounds=match_info.get('overtime_rounds', 0)
-            )
-            
-            return match_result
-            
-        except Exception as e:
-            logger.error(f"Error parsing match data: {str(e)}")
+    @staticmethod
+    async def _read_body(response: httpx.Response) -> bytes:
+        """Stream the response body, keeping nothing past the closing body tag
+        
+        Over HTTP/2 the read stops at the tag, which only resets that stream.
+        Over HTTP/1.1 stopping early would close the pooled keep-alive
+        connection, so the few bytes after the tag are drained and dropped;
+        reusing the connection is worth more than skipping them.
+        """
+        body = bytearray()
+        stop_early = response.http_version == "HTTP/2"
+        chunks = response.aiter_bytes()
+        async for chunk in chunks:
+            body += chunk
+            # Only search the new bytes, overlapping enough to catch a split tag
+            start = max(0, len(body) - len(chunk) - len(_BODY_END))
+            if body.find(_BODY_END, start) != -1:
+                break
+        else:
+            return bytes(body)
+        
+        if not stop_early:
+            async for _ in chunks:
+                pass
+        return bytes(body)
+    
+    def _backoff_delay(self, retry: int) -> float:
+        """Exponential backoff with random jitter"""
+        delay = min(self._delay * 2 ** retry, self._backoff_cap)
+        return delay + random.uniform(0, self._jitter)
+
+
+def parse_match_bytes(html_bytes: bytes, match_url: str) -> Optional[Dict[str, Any]]:
+    """Parse a match page into a picklable dict of MatchResult fields
+    
+    Runs in a worker process, so it must stay a pure top-level function.
+    """
+    try:
+        # Stream the page through the target; no element tree is built
+        parser = etree.HTMLParser(target=_MatchTarget(), encoding='utf-8')  # tracker.gg serves UTF-8
+        parser.feed(html_bytes)
+        page: _MatchTarget = parser.close()
+        
+        # Extract basic match info
+        match_info = _extract_match_info(page.fields)
+        if not match_info:
+            return None
+        
+        # Extract player data
+        players = _extract_player_data(page)
+        if not players:
+            logger.warning("No player data found")
             return None
+        
+        # Collect match result fields
+        return {
+            'match_id': match_info.get('match_id', 'unknown'),
+            'match_url': match_url,
+            'game_mode': match_info.get('game_mode', GameMode.DEATHMATCH),
+            'map_name': match_info.get('map_name', MapName.ASCENT),
+            'match_duration': match_info.get('duration', 0),
+            'match_date': match_info.get('date', datetime.now()),
+            'red_team_score': match_info.get('red_score', 0),
+            'blue_team_score': match_info.get('blue_score', 0),
+            'winner': match_info.get('winner', 'Unknown'),
+            'players': players,
+            'total_rounds': match_info.get('total_rounds', 0),
+            'overtime_rounds': match_info.get('overtime_rounds', 0)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error parsing match data: {str(e)}")
+        return None
+
+
+def _extract_match_info(fields: Dict[str, list[str]]) -> Dict[str, Any]:
+    """Extract basic match information from match-level texts, binned by class"""
+    match_info = {}
     
-    def _extract_match_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract basic match information"""
-        match_info = {}
+    try:
+        # Extract match ID from URL or page
+        match_info['match_id'] = 'unknown'  # Will be extracted from URL or page
         
-        try:
-            # Extract match ID from URL or page
-            match_info['match_id'] = 'unknown'  # Will be extracted from URL or page
-            
-            # Extract game mode
-            game_mode_elem = soup.find('div', class_='game-mode')
-            if game_mode_elem:
-                mode_text = game_mode_elem.get_text().strip().lower()
-                if 'deathmatch' in mode_text:
-                    match_info['game_mode'] = GameMode.DEATHMATCH
-                elif 'unrated' in mode_text:
-                    match_info['game_mode'] = GameMode.UNRATED
-                elif 'competitive' in mode_text:
-                    match_info['game_mode'] = GameMode.COMPETITIVE
-                else:
-                    match_info['game_mode'] = GameMode.DEATHMATCH
-            else:
-                match_info['game_mode'] = GameMode.DEATHMATCH
-            
-            # Extract map name
-            map_elem = soup.find('div', class_='map-name')
-            if map_elem:
-                map_text = map_elem.get_text().strip().lower()
-                for map_name in MapName:
-                    if map_name.value in map_text:
-                        match_info['map_name'] = map_name
-                        break
-                else:
-                    match_info['map_name'] = MapName.ASCENT
-            else:
-                match_info['map_name'] = MapName.ASCENT
-            
-            # Extract scores
-            score_elems = soup.find_all('div', class_='score')
-            if len(score_elems) >= 2:
-                match_info['red_score'] = int(score_elems[0].get_text().strip())
-                match_info['blue_score'] = int(score_elems[1].get_text().strip())
-                
-                # Determine winner
-                if match_info['red_score'] > match_info['blue_score']:
-                    match_info['winner'] = 'Red'
-                elif match_info['blue_score'] > match_info['red_score']:
-                    match_info['winner'] = 'Blue'
-                else:
-                    match_info['winner'] = 'Tie'
-            else:
-                match_info['red_score'] = 0
-                match_info['blue_score'] = 0
-                match_info['winner'] = 'Unknown'
-            
-            # Extract duration
-            duration_elem = soup.find('div', class_='duration')
-            if duration_elem:
-                duration_text = duration_elem.get_text().strip()
-                match_info['duration'] = self._parse_duration(duration_text)
-            else:
-                match_info['duration'] = 0
-            
-            # Extract date
-            date_elem = soup.find('div', class_='match-date')
-            if date_elem:
-                date_text = date_elem.get_text().strip()
-                match_info['date'] = self._parse_date(date_text)
+        # Extract game mode
+        mode_texts = fields.get('game-mode')
+        if mode_texts:
+            mode_text = mode_texts[0].lower()
+            match_info['game_mode'] = next(
+                (mode for keyword, mode in _MODE_KEYWORDS.items() if keyword in mode_text),
+                GameMode.DEATHMATCH
+            )
+        else:
+            match_info['game_mode'] = GameMode.DEATHMATCH
+        
+        # Extract map name
+        map_texts = fields.get('map-name')
+        if map_texts:
+            map_text = map_texts[0].lower()
+            match_info['map_name'] = next(
+                (map_name for value, map_name in _MAP_LOOKUP.items() if value in map_text),
+                MapName.ASCENT
+            )
+        else:
+            match_info['map_name'] = MapName.ASCENT
+        
+        # Extract scores
+        score_texts = fields.get('score', [])
+        if len(score_texts) >= 2:
+            match_info['red_score'] = int(score_texts[0])
+            match_info['blue_score'] = int(score_texts[1])
+            
+            # Determine winner
+            if match_info['red_score'] > match_info['blue_score']:
+                match_info['winner'] = 'Red'
+            elif match_info['blue_score'] > match_info['red_score']:
+                match_info['winner'] = 'Blue'
             else:
-                match_info['date'] = datetime.now()
-            
-            # Extract round info
-            match_info['total_rounds'] = 0
-            match_info['overtime_rounds'] = 0
-            
-        except Exception as e:
-            logger.error(f"Error extracting match info: {str(e)}")
+                match_info['winner'] = 'Tie'
+        else:
+            match_info['red_score'] = 0
+            match_info['blue_score'] = 0
+            match_info['winner'] = 'Unknown'
         
-        return match_info
-    
-    def _extract_player_data(self, soup: BeautifulSoup) -> list[PlayerPerformance]:
-        """Extract player performance data"""
-        players = []
+        # Extract duration
+        duration_texts = fields.get('duration')
+        if duration_texts:
+            match_info['duration'] = _parse_duration(duration_texts[0])
+        else:
+            match_info['duration'] = 0
         
-        try:
-            # Find player containers
-            player_containers = soup.find_all('div', class_='player-stats')
-            
-            for container in player_containers:
-                try:
-                    player_data = self._parse_player_container(container)
-                    if player_data:
-                        players.append(player_data)
-                except Exception as e:
-                    logger.warning(f"Error parsing player container: {str(e)}")
-                    continue
-            
-            # If no structured data found, try alternative parsing
-            if not players:
-                players = self._parse_alternative_player_data(soup)
-            
-        except Exception as e:
-            logger.error(f"Error extracting player data: {str(e)}")
+        # Extract date
+        date_texts = fields.get('match-date')
+        if date_texts:
+            match_info['date'] = _parse_date(date_texts[0])
+        else:
+            match_info['date'] = datetime.now()
+        
+        # Extract round info
+        match_info['total_rounds'] = 0
+        match_info['overtime_rounds'] = 0
         
-        return players
+    except Exception as e:
+        logger.error(f"Error extracting match info: {str(e)}")
     
-    def _parse_player_container(self, container: BeautifulSoup) -> Optional[PlayerPerformance]:
-        """Parse individual player container"""
-        try:
-            # Extract player name
-            name_elem = container.find('div', class_='player-name')
-            player_name = name_elem.get_text().strip() if name_elem else "Unknown Player"
-            
-            # Extract team
-            team_elem = container.find('div', class_='team')
-            team = team_elem.get_text().strip() if team_elem else "Unknown"
-            
-            # Extract stats
-            kills = self._extract_stat(container, 'kills', 0)
-            deaths = self._extract_stat(container, 'deaths', 0)
-            assists = self._extract_stat(container, 'assists', 0)
-            score = self._extract_stat(container, 'score', 0)
-            
-            # Calculate K/D ratio
-            kd_ratio = kills / deaths if deaths > 0 else kills
-            
-            # Extract additional stats
-            headshots = self._extract_stat(container, 'headshots', 0)
-            damage_dealt = self._extract_stat(container, 'damage-dealt', 0)
-            damage_taken = self._extract_stat(container, 'damage-taken', 0)
-            
-            # Calculate headshot percentage
-            headshot_percentage = (headshots / kills * 100) if kills > 0 else 0.0
-            
-            return PlayerPerformance(
-                player_name=player_name,
-                team=team,
-                kills=kills,
-                deaths=deaths,
-                assists=assists,
-                score=score,
-                kd_ratio=kd_ratio,
-                headshots=headshots,
-                headshot_percentage=headshot_percentage,
-                damage_dealt=damage_dealt,
-                damage_taken=damage_taken,
-                utility_used=0,  # Not typically available in deathmatch
-                first_bloods=0,  # Not typically available in deathmatch
-                clutches=0  # Not typically available in deathmatch
-            )
-            
-        except Exception as e:
-            logger.warning(f"Error parsing player container: {str(e)}")
-            return None
+    return match_info
+
+
+def _extract_player_data(page: _MatchTarget) -> list[Dict[str, Any]]:
+    """Extract player performance data"""
+    players = []
     
-    def _parse_alternative_player_data(self, soup: BeautifulSoup) -> list[PlayerPerformance]:
-        """Alternative parsing method for player data"""
-        players = []
+    try:
+        # Each player container is its divs' texts keyed by class
+        for container in page.players:
+            try:
+                player_data = _parse_player_container(container)
+                if player_data:
+                    players.append(player_data)
+            except Exception as e:
+                logger.warning(f"Error parsing player container: {str(e)}")
+                continue
         
-        try:
-            # Look for table-based player data
-            player_tables = soup.find_all('table', class_='player-table')
-            
-            for table in player_tables:
-                rows = table.find_all('tr')
-                for row in rows[1:]:  # Skip header row
-                    cells = row.find_all('td')
-                    if len(cells) >= 6:
-                        try:
-                            player_name = cells[0].get_text().strip()
-                            team = cells[1].get_text().strip()
-                            kills = int(cells[2].get_text().strip())
-                            deaths = int(cells[3].get_text().strip())
-                            assists = int(cells[4].get_text().strip())
-                            score = int(cells[5].get_text().strip())
-                            
-                            kd_ratio = kills / deaths if deaths > 0 else kills
-                            
-                            players.append(PlayerPerformance(
-                                player_name=player_name,
-                                team=team,
-                                kills=kills,
-                                deaths=deaths,
-                                assists=assists,
-                                score=score,
-                                kd_ratio=kd_ratio
-                            ))
-                        except (ValueError, IndexError):
-                            continue
-            
-        except Exception as e:
-            logger.error(f"Error in alternative player parsing: {str(e)}")
+        # If no structured data found, try alternative parsing
+        if not players:
+            players = _parse_alternative_player_data(page.tables)
         
-        return players
+    except Exception as e:
+        logger.error(f"Error extracting player data: {str(e)}")
     
-    def _extract_stat(self, container: BeautifulSoup, stat_name: str, default: int = 0) -> int:
-        """Extract a specific stat from player container"""
-        try:
-            stat_elem = container.find('div', class_=stat_name)
-            if stat_elem:
-                stat_text = stat_elem.get_text().strip()
-                return int(stat_text)
-        except (ValueError, AttributeError):
-            pass
-        return default
+    return players
+
+
+def _parse_player_container(fields: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Parse individual player container from its class-indexed texts"""
+    try:
+        # Extract player name
+        player_name = fields.get('player-name', "Unknown Player")
+        
+        # Extract team
+        team = fields.get('team', "Unknown")
+        
+        # Extract stats
+        kills = _extract_stat(fields, 'kills', 0)
+        deaths = _extract_stat(fields, 'deaths', 0)
+        assists = _extract_stat(fields, 'assists', 0)
+        score = _extract_stat(fields, 'score', 0)
+        
+        # Calculate K/D ratio
+        kd_ratio = kills / deaths if deaths > 0 else float(kills)
+        
+        # Extract additional stats
+        headshots = _extract_stat(fields, 'headshots', 0)
+        damage_dealt = _extract_stat(fields, 'damage-dealt', 0)
+        damage_taken = _extract_stat(fields, 'damage-taken', 0)
+        
+        # Calculate headshot percentage
+        headshot_percentage = (headshots / kills * 100) if kills > 0 else 0.0
+        
+        return {
+            'player_name': player_name,
+            'team': team,
+            'kills': kills,
+            'deaths': deaths,
+            'assists': assists,
+            'score': score,
+            'kd_ratio': kd_ratio,
+            'headshots': headshots,
+            'headshot_percentage': headshot_percentage,
+            'damage_dealt': damage_dealt,
+            'damage_taken': damage_taken,
+            'utility_used': 0,  # Not typically available in deathmatch
+            'first_bloods': 0,  # Not typically available in deathmatch
+            'clutches': 0  # Not typically available in deathmatch
+        }
+        
+    except Exception as e:
+        logger.warning(f"Error parsing player container: {str(e)}")
+        return None
+
+
+def _parse_alternative_player_data(tables: list[list[list[str]]]) -> list[Dict[str, Any]]:
+    """Alternative parsing method for player data"""
+    players = []
     
-    def _parse_duration(self, duration_text: str) -> int:
-        """Parse duration string to seconds"""
-        try:
-            # Handle formats like "15:30" or "1:23:45"
-            parts = duration_text.split(':')
-            if len(parts) == 2:
-                minutes, seconds = map(int, parts)
-                return minutes * 60 + seconds
-            elif len(parts) == 3:
-                hours, minutes, seconds = map(int, parts)
-                return hours * 3600 + minutes * 60 + seconds
-        except (ValueError, IndexError):
-            pass
+    try:
+        # Look for table-based player data
+        for rows in tables:
+            for cells in rows[1:]:  # Skip header row
+                if len(cells) >= 6:
+                    try:
+                        player_name = cells[0]
+                        team = cells[1]
+                        kills = int(cells[2])
+                        deaths = int(cells[3])
+                        assists = int(cells[4])
+                        score = int(cells[5])
+                        
+                        kd_ratio = kills / deaths if deaths > 0 else float(kills)
+                        
+                        players.append({
+                            'player_name': player_name,
+                            'team': team,
+                            'kills': kills,
+                            'deaths': deaths,
+                            'assists': assists,
+                            'score': score,
+                            'kd_ratio': kd_ratio
+                        })
+                    except (ValueError, IndexError):
+                        continue
+        
+    except Exception as e:
+        logger.error(f"Error in alternative player parsing: {str(e)}")
+    
+    return players
+
+
+def _extract_stat(fields: Dict[str, str], stat_name: str, default: int = 0) -> int:
+    """Extract a specific stat from a player's class-indexed texts"""
+    try:
+        stat_text = fields.get(stat_name)
+        if stat_text is not None:
+            return int(stat_text)
+    except (ValueError, AttributeError):
+        pass
+    return default
+
+
+def _parse_duration(duration_text: str) -> int:
+    """Parse duration string to seconds"""
+    # Handle formats like "15:30" or "1:23:45"
+    match = _DURATION_RE.fullmatch(duration_text)
+    if not match:
         return 0
+    hours, minutes, seconds = match.groups(default='0')
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+
+
+def _parse_date(date_text: str) -> datetime:
+    """Parse date string to datetime"""
+    # Fast path for ISO dates like "2024-01-01" or "2024-01-01 12:00:00"
+    try:
+        return datetime.fromisoformat(date_text)
+    except ValueError:
+        pass
     
-    def _parse_date(self, date_text: str) -> datetime:
-        """Parse date string to datetime"""
+    for fmt in _DATE_FORMATS:
         try:
-            # Handle various date formats
-            date_formats = [
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d",
-                "%m/%d/%Y",
-                "%d/%m/%Y"
-            ]
-            
-            for fmt in date_formats:
-                try:
-                    return datetime.strptime(date_text, fmt)
-                except ValueError:
-                    continue
-            
-        except Exception:
-            pass
-        
-        return datetime.now()
+            return datetime.strptime(date_text, fmt)
+        except ValueError:
+            continue
+    
+    return datetime.now()
@@ -0,0 +1,31 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Async token-bucket rate limiter; a rate of 0 or less disables limiting"""
+
+    def __init__(self, requests_per_second: float, burst: int = 1):
+        self.rate = requests_per_second
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                # Sleep just long enough for the next token to accrue
+                await asyncio.sleep((1 - self._tokens) / self.rate)
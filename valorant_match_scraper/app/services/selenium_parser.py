@@ -4,31 +4,317 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.driver_finder import DriverFinder
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+import orjson
+import soupsieve
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import asyncio
+import itertools
+import os
+import queue
+import re
+import threading
 import time
 import logging
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from datetime import datetime
 
 from ..core.config import settings
 from ..schemas.match import MatchResult, PlayerPerformance, GameMode, MapName, ScrapingResponse
+from .tracker_api import parse_match_json
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Tags and class fragments queried by the match info extractor and the table fallback
+_STRAINED_TAGS = frozenset({'title', 'table', 'h1', 'h2', 'h3'})
+_STRAINED_CLASS_RE = re.compile(r'map|location|mode|playlist|type')
+
+# Player selectors, in the order their matches are reported
+_PLAYER_SELECTORS = [
+    'div[class*="player"]',
+    'tr[class*="player"]',
+    'div[class*="stats"]',
+    'tr[class*="stats"]',
+    'div[class*="participant"]',
+    'tr[class*="participant"]',
+    'div[class*="roster"]',
+    'tr[class*="roster"]',
+    'div[class*="team"]',
+    'tr[class*="team"]',
+    'table tbody tr',  # Generic table rows
+    'div[class*="match"] div[class*="player"]',  # Nested selectors
+]
+_PLAYER_CLASS_SELECTORS = [
+    ('div', 'player'), ('tr', 'player'),
+    ('div', 'stats'), ('tr', 'stats'),
+    ('div', 'participant'), ('tr', 'participant'),
+    ('div', 'roster'), ('tr', 'roster'),
+    ('div', 'team'), ('tr', 'team'),
+]
+_TABLE_ROW_SELECTOR = 10
+_NESTED_PLAYER_SELECTOR = 11
+
+# Heavy resources the parser never needs, blocked in every driver
+_BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+_BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.css', '*.mp4', '*.webm',
+    '*googletagmanager*', '*google-analytics*', '*doubleclick*',
+]
+
+# Keyword -> game mode lookup for candidate text, checked in order
+_MODE_KEYWORDS = {
+    'deathmatch': GameMode.DEATHMATCH,
+    'unrated': GameMode.UNRATED,
+    'competitive': GameMode.COMPETITIVE,
+}
+
+# Map names matched in one pass over candidate text
+_MAP_LOOKUP = {m.value: m for m in MapName}
+_MAP_RE = re.compile('|'.join(map(re.escape, _MAP_LOOKUP)))
+
+# JSON payload Next.js embeds in server-rendered pages
+_NEXT_DATA_RE = re.compile(r'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.S)
+
+# Size of the chunks fed to the streaming player parser
+_FEED_CHUNK_SIZE = 64 * 1024
+
+# Text nodes BeautifulSoup's get_text() would return, skipping script/style/template content
+_TEXT_XPATH = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::template or ancestor::rp or ancestor::rt)]'
+)
+# First div/span/td descendant whose class contains a fragment (case-insensitive), per fragment
+_CLASS_XPATHS = {
+    fragment: etree.XPath(
+        './/*[self::div or self::span or self::td]'
+        f'[contains(translate(@class, "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"), "{fragment}")]'
+    )
+    for fragment in ('name', 'team', 'kills', 'kill', 'deaths', 'death', 'assists', 'assist', 'score')
+}
+
+# Match info selectors, compiled once and checked in order
+_GAME_MODE_SELECTOR_LIST = (
+    'div[class*="game-mode"]',
+    'span[class*="game-mode"]',
+    'div[class*="mode"]',
+    'span[class*="mode"]',
+    'div[class*="playlist"]',
+    'span[class*="playlist"]',
+    'div[class*="type"]',
+    'span[class*="type"]',
+    'h1', 'h2', 'h3'  # Sometimes mode is in headers
+)
+_GAME_MODE_SELECTORS = [soupsieve.compile(selector) for selector in _GAME_MODE_SELECTOR_LIST]
+# Union of the game mode selectors, so candidates are found in a single tree walk
+_GAME_MODE_UNION = soupsieve.compile(', '.join(_GAME_MODE_SELECTOR_LIST))
+_MAP_SELECTORS = [
+    soupsieve.compile(selector)
+    for selector in (
+        'div[class*="map"]',
+        'span[class*="map"]',
+        'div[class*="location"]',
+        'span[class*="location"]'
+    )
+]
+
+
+class _MatchStrainer(SoupStrainer):
+    """SoupStrainer that only builds the subtrees the extractors look at"""
+    
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name in _STRAINED_TAGS:
+            return True
+        classes = (attrs or {}).get('class')
+        if isinstance(classes, list):
+            classes = ' '.join(classes)
+        return bool(classes and _STRAINED_CLASS_RE.search(classes))
+
+
+MATCH_STRAINER = _MatchStrainer()
+
+
+@lru_cache
+def _chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process, via Selenium Manager unless CHROMEDRIVER_PATH is set"""
+    return DriverFinder.get_path(Service(settings.chromedriver_path), Options())
+
+
+def _match_player_selectors(elem) -> list[int]:
+    """Return the indexes of the player selectors an opening element matches"""
+    tag = elem.tag
+    classes = elem.get('class')
+    matched = []
+    
+    if classes:
+        for index, (selector_tag, fragment) in enumerate(_PLAYER_CLASS_SELECTORS):
+            if tag == selector_tag and fragment in classes:
+                matched.append(index)
+    
+    if tag == 'tr':
+        for tbody in elem.iterancestors('tbody'):
+            if next(tbody.iterancestors('table'), None) is not None:
+                matched.append(_TABLE_ROW_SELECTOR)
+                break
+    elif tag == 'div' and classes and 'player' in classes:
+        for ancestor in elem.iterancestors('div'):
+            if 'match' in ancestor.get('class', ''):
+                matched.append(_NESTED_PLAYER_SELECTOR)
+                break
+    
+    return matched
+
+
+def _element_text(elem, texts: Dict[Any, str]) -> str:
+    """Return the stripped text of an lxml element, memoized in texts"""
+    text = texts.get(elem)
+    if text is None:
+        text = texts[elem] = ''.join(_TEXT_XPATH(elem)).strip()
+    return text
+
+
+def _soup_text(elem, texts: Dict[int, str]) -> str:
+    """Return the stripped, lowercased text of a BeautifulSoup element, memoized in texts"""
+    key = id(elem)
+    text = texts.get(key)
+    if text is None:
+        text = texts[key] = elem.get_text().strip().lower()
+    return text
+
+
+class DriverPool:
+    """Thread-safe pool of pre-warmed Selenium drivers"""
+    
+    def __init__(
+        self,
+        size: int,
+        build_driver: Callable[[], Optional[webdriver.Chrome]],
+        max_uses: int = 0,
+        clear_cookies_every: int = 0
+    ):
+        self.size = size
+        self._build_driver = build_driver
+        self._max_uses = max_uses
+        self._clear_cookies_every = clear_cookies_every
+        self._queue: queue.Queue = queue.Queue(maxsize=size)
+        self._uses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._started = False
+    
+    @property
+    def available(self) -> int:
+        """Number of live drivers in the pool"""
+        return len(self._uses)
+    
+    def start(self):
+        """Launch the pool's drivers if they aren't running yet"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            for _ in range(self.size):
+                self._add_driver()
+            logger.info(f"Selenium driver pool started with {self.available}/{self.size} drivers")
+    
+    def _replenish(self):
+        """Rebuild a driver lost to a failed replacement when none is idle"""
+        with self._lock:
+            if self._queue.empty() and len(self._uses) < self.size:
+                logger.info(f"Rebuilding Selenium driver ({self.available}/{self.size} running)")
+                self._add_driver()
+    
+    def _add_driver(self):
+        """Build a new driver and put it in the pool"""
+        driver = self._build_driver()
+        if driver:
+            self._uses[id(driver)] = 0
+            self._queue.put(driver)
+    
+    def acquire(self, timeout: Optional[float] = None) -> Optional[webdriver.Chrome]:
+        """Check a driver out of the pool, or return None if none is available"""
+        # Each driver is used by one worker at a time, so the single-connection HTTP
+        # pool inside its RemoteConnection is never contended between threads
+        self.start()
+        self._replenish()
+        if not self.available:
+            return None
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+    
+    def release(self, driver: webdriver.Chrome, broken: bool = False):
+        """Return a driver to the pool, replacing it if its session broke or it has been used too often"""
+        if broken:
+            logger.warning("Replacing Selenium driver after its session was lost")
+            self._discard(driver)
+            self._add_driver()
+            return
+        
+        uses = self._uses.get(id(driver), 0) + 1
+        if self._max_uses and uses >= self._max_uses:
+            logger.info(f"Recycling Selenium driver after {uses} uses")
+            self._discard(driver)
+            self._add_driver()
+            return
+        
+        # Keep the session alive but drop its cookies now and then
+        if self._clear_cookies_every and uses % self._clear_cookies_every == 0:
+            try:
+                driver.delete_all_cookies()
+            except Exception as e:
+                logger.warning(f"Error clearing Selenium driver cookies: {str(e)}")
+        
+        self._uses[id(driver)] = uses
+        self._queue.put(driver)
+    
+    def _discard(self, driver: webdriver.Chrome):
+        """Quit a driver and forget about it"""
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting Selenium driver: {str(e)}")
+    
+    def close(self):
+        """Quit every driver in the pool"""
+        while True:
+            try:
+                self._discard(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        self._started = False
+
 
 class SeleniumMatchParser:
     """Selenium-based service for parsing Valorant match data from tracker.gg"""
     
-    def __init__(self):
-        self.driver = None
-        self._setup_driver()
+    def __init__(self, pool_size: Optional[int] = None):
+        pool_size = pool_size or settings.selenium_pool_size or os.cpu_count() or 1
+        self.pool = DriverPool(
+            pool_size,
+            self._setup_driver,
+            settings.max_driver_uses if settings.clean_sessions else 0,
+            settings.clear_cookies_every
+        )
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="selenium")
     
-    def _setup_driver(self):
+    def _setup_driver(self) -> Optional[webdriver.Chrome]:
         """Setup Chrome driver with anti-detection options"""
         try:
             chrome_options = Options()
+            # Run without a window or GPU so pooled drivers stay light
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--window-size=1280,900")
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-blink-features=AutomationControlled")
@@ -39,51 +325,80 @@ class SeleniumMatchParser:
             # Add additional headers to appear more human-like
             chrome_options.add_argument("--disable-web-security")
             chrome_options.add_argument("--allow-running-insecure-content")
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
             
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Skip images, stylesheets and fonts, which are most of a tracker.gg page's weight
+            chrome_options.add_experimental_option("prefs", _BLOCKED_CONTENT_PREFS)
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            
+            # Return from driver.get at DOMContentLoaded; the player-data wait covers the rest
+            chrome_options.page_load_strategy = 'eager'
+            
+            # Pooled drivers are rebuilt often, so resolve chromedriver once rather than per driver
+            service = Service(_chromedriver_path())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Execute script to remove webdriver property
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            
+            # Block remaining media, fonts and trackers at the network layer
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
             
             logger.info("Selenium driver setup complete")
+            return driver
             
         except Exception as e:
             logger.error(f"Failed to setup Selenium driver: {str(e)}")
-            self.driver = None
+            return None
     
-    def scrape_match(self, match_url: str) -> ScrapingResponse:
-        """Scrape match data using Selenium"""
+    async def startup(self):
+        """Pre-warm the driver pool"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.pool.start)
+    
+    async def scrape_match(self, match_url: str) -> ScrapingResponse:
+        """Scrape match data using a pooled Selenium driver"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._scrape_sync, match_url)
+    
+    async def scrape_matches(self, match_urls: list[str]) -> list[ScrapingResponse]:
+        """Scrape several matches in parallel, one pooled driver per worker"""
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*[
+            loop.run_in_executor(self._executor, self._scrape_sync, match_url)
+            for match_url in match_urls
+        ])
+    
+    def _scrape_sync(self, match_url: str) -> ScrapingResponse:
+        """Scrape match data using Selenium (blocking)"""
         start_time = time.time()
         
+        driver = self.pool.acquire(timeout=settings.request_timeout)
+        if not driver:
+            return ScrapingResponse(
+                success=False,
+                error_message="Selenium driver not available",
+                processing_time=time.time() - start_time
+            )
+        
+        broken = False
         try:
-            if not self.driver:
-                return ScrapingResponse(
-                    success=False,
-                    error_message="Selenium driver not available",
-                    processing_time=time.time() - start_time
-                )
-            
             logger.info(f"Starting to scrape match with Selenium: {match_url}")
             
             # Navigate to the page
-            self.driver.get(match_url)
+            driver.get(match_url)
             
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Add a small delay to let JavaScript load
-            time.sleep(3)
-            
-            # Get the page source
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            # Wait until JavaScript has rendered player data instead of sleeping a fixed time
+            try:
+                WebDriverWait(driver, 10).until(EC.any_of(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'div[class*="player"]')),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'table tbody tr'))
+                ))
+            except TimeoutException:
+                logger.warning("Player data did not render in time, parsing the page as loaded")
             
             # Extract match data
-            match_data = self._parse_match_data(soup, match_url)
+            match_data = self._parse_match_data(driver.page_source, match_url)
             
             if not match_data:
                 return ScrapingResponse(
@@ -102,23 +417,34 @@ class SeleniumMatchParser:
             )
             
         except Exception as e:
+            # Anything but a wait timeout means the browser session can't be trusted anymore
+            broken = isinstance(e, WebDriverException) and not isinstance(e, TimeoutException)
             logger.error(f"Error scraping match with Selenium: {str(e)}")
             return ScrapingResponse(
                 success=False,
                 error_message=f"Unexpected error: {str(e)}",
                 processing_time=time.time() - start_time
             )
+        finally:
+            self.pool.release(driver, broken)
     
-    def _parse_match_data(self, soup: BeautifulSoup, match_url: str) -> Optional[MatchResult]:
-        """Parse match data from BeautifulSoup object"""
+    def _parse_match_data(self, page_source: str, match_url: str) -> Optional[MatchResult]:
+        """Parse match data from the rendered page source"""
         try:
+            # Read the embedded match payload when the page has one, instead of scanning the DOM
+            match_result = self._from_next_data(page_source, match_url)
+            if match_result:
+                return match_result
+            
+            soup = BeautifulSoup(page_source, 'lxml', parse_only=MATCH_STRAINER)
+            
             # Extract basic match info
             match_info = self._extract_match_info(soup)
             if not match_info:
                 return None
             
             # Extract player data
-            players = self._extract_player_data(soup)
+            players = self._extract_player_data(page_source, soup)
             if not players:
                 logger.warning("No player data found")
                 return None
@@ -145,6 +471,27 @@ class SeleniumMatchParser:
             logger.error(f"Error parsing match data: {str(e)}")
             return None
     
+    def _from_next_data(self, page_source: str, match_url: str) -> Optional[MatchResult]:
+        """Build the match from the page's __NEXT_DATA__ payload, if it has a usable one"""
+        found = _NEXT_DATA_RE.search(page_source)
+        if not found:
+            return None
+        
+        # Any unexpected shape means falling back to the DOM, never failing the whole parse
+        try:
+            match = orjson.loads(found.group(1))['props']['pageProps']['match']
+            if not isinstance(match, dict):
+                logger.warning("Ignoring __NEXT_DATA__ payload without a match object")
+                return None
+            
+            # The page carries the same segments as the tracker.gg match API
+            payload = match if 'data' in match else {'data': match}
+            match_id = match_url.rstrip('/').rsplit('/', 1)[-1]
+            return parse_match_json(payload, match_id, match_url)
+        except Exception as e:
+            logger.warning(f"Ignoring unusable __NEXT_DATA__ payload: {str(e)}")
+            return None
+    
     def _extract_match_info(self, soup: BeautifulSoup, match_url: str = None) -> Dict[str, Any]:
         """Extract basic match information"""
         match_info = {}
@@ -162,67 +509,45 @@ class SeleniumMatchParser:
             if title:
                 logger.info(f"Page title: {title.get_text()}")
             
-            # Try to find game mode in various elements - updated selectors for tracker.gg
-            game_mode_selectors = [
-                'div[class*="game-mode"]',
-                'span[class*="game-mode"]',
-                'div[class*="mode"]',
-                'span[class*="mode"]',
-                'div[class*="playlist"]',
-                'span[class*="playlist"]',
-                'div[class*="type"]',
-                'span[class*="type"]',
-                'h1', 'h2', 'h3'  # Sometimes mode is in headers
-            ]
+            # Lowercased text per element, shared by the game mode and map lookups
+            texts: Dict[int, str] = {}
+            debug = logger.isEnabledFor(logging.DEBUG)
             
-            game_mode_found = False
-            for selector in game_mode_selectors:
-                elements = soup.select(selector)
-                for elem in elements:
-                    mode_text = elem.get_text().strip().lower()
-                    logger.info(f"Checking element for game mode: {mode_text}")
-                    
-                    if 'deathmatch' in mode_text:
-                        match_info['game_mode'] = GameMode.DEATHMATCH
-                        game_mode_found = True
-                        logger.info("Found deathmatch mode")
-                        break
-                    elif 'unrated' in mode_text:
-                        match_info['game_mode'] = GameMode.UNRATED
-                        game_mode_found = True
-                        logger.info("Found unrated mode")
-                        break
-                    elif 'competitive' in mode_text:
-                        match_info['game_mode'] = GameMode.COMPETITIVE
-                        game_mode_found = True
-                        logger.info("Found competitive mode")
+            # Try to find game mode in various elements - updated selectors for tracker.gg
+            # Walk the tree once for every selector, keeping the first hit of the highest-priority one
+            best_mode = None
+            for elem in _GAME_MODE_UNION.select(soup):
+                # Once a mode is found, only elements from higher-priority selectors can replace it
+                priority = next(i for i, pattern in enumerate(_GAME_MODE_SELECTORS) if pattern.match(elem))
+                if best_mode is not None and priority >= best_mode[0]:
+                    continue
+                
+                mode_text = _soup_text(elem, texts)
+                if debug:
+                    logger.debug(f"Checking element for game mode: {mode_text}")
+                
+                mode = next((m for keyword, m in _MODE_KEYWORDS.items() if keyword in mode_text), None)
+                if mode is not None:
+                    best_mode = (priority, mode)
+                    if priority == 0:
                         break
-                if game_mode_found:
-                    break
             
-            if not game_mode_found:
+            if best_mode:
+                match_info['game_mode'] = best_mode[1]
+                logger.info(f"Found {best_mode[1].value} mode")
+            else:
                 match_info['game_mode'] = GameMode.DEATHMATCH
                 logger.info("Using default deathmatch mode")
             
             # Try to find map name
-            map_selectors = [
-                'div[class*="map"]',
-                'span[class*="map"]',
-                'div[class*="location"]',
-                'span[class*="location"]'
-            ]
-            
             map_found = False
-            for selector in map_selectors:
-                elem = soup.select_one(selector)
+            for pattern in _MAP_SELECTORS:
+                elem = pattern.select_one(soup)
                 if elem:
-                    map_text = elem.get_text().strip().lower()
-                    for map_name in MapName:
-                        if map_name.value in map_text:
-                            match_info['map_name'] = map_name
-                            map_found = True
-                            break
-                    if map_found:
+                    map_match = _MAP_RE.search(_soup_text(elem, texts))
+                    if map_match:
+                        match_info['map_name'] = _MAP_LOOKUP[map_match.group()]
+                        map_found = True
                         break
             
             if not map_found:
@@ -242,42 +567,69 @@ class SeleniumMatchParser:
         
         return match_info
     
-    def _extract_player_data(self, soup: BeautifulSoup) -> list[PlayerPerformance]:
+    def _stream_players(self, page_source: str):
+        """Stream-parse the page, yielding each player element's position, selector matches and parsed player"""
+        parser = etree.HTMLPullParser(events=('start', 'end'))
+        # Feed slices of the page text itself, so no encoded copy of the whole page is made
+        chunks = (
+            page_source[i:i + _FEED_CHUNK_SIZE]
+            for i in range(0, len(page_source), _FEED_CHUNK_SIZE)
+        )
+        
+        # Selector matches and position of each open element, and how many open elements matched any
+        open_matches = []
+        open_players = 0
+        position = 0
+        # Text of sub-elements shared by nested player containers
+        texts: Dict[Any, str] = {}
+        
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is None:
+                parser.close()
+            else:
+                parser.feed(chunk)
+            
+            for event, elem in parser.read_events():
+                if event == 'start':
+                    matched = _match_player_selectors(elem)
+                    open_matches.append((matched, position))
+                    open_players += bool(matched)
+                    position += 1
+                    continue
+                
+                matched, start_position = open_matches.pop()
+                if matched:
+                    open_players -= 1
+                    yield start_position, matched, self._parse_player_element(elem, texts)
+                
+                # Nothing still open needs this subtree, so free it
+                if not open_players:
+                    texts.clear()
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+    
+    def _extract_player_data(self, page_source: str, soup: BeautifulSoup) -> list[PlayerPerformance]:
         """Extract player performance data"""
         players = []
         
         try:
-            # Look for player data in various formats - updated for tracker.gg
-            player_selectors = [
-                'div[class*="player"]',
-                'tr[class*="player"]',
-                'div[class*="stats"]',
-                'tr[class*="stats"]',
-                'div[class*="participant"]',
-                'tr[class*="participant"]',
-                'div[class*="roster"]',
-                'tr[class*="roster"]',
-                'div[class*="team"]',
-                'tr[class*="team"]',
-                'table tbody tr',  # Generic table rows
-                'div[class*="match"] div[class*="player"]',  # Nested selectors
-            ]
-            
             logger.info("Searching for player data...")
             
-            for selector in player_selectors:
-                elements = soup.select(selector)
-                logger.info(f"Found {len(elements)} elements with selector: {selector}")
-                
-                for elem in elements:
-                    try:
-                        player_data = self._parse_player_element(elem)
-                        if player_data:
-                            players.append(player_data)
-                            logger.info(f"Added player: {player_data.player_name}")
-                    except Exception as e:
-                        logger.warning(f"Error parsing player element: {str(e)}")
-                        continue
+            # Players are streamed as their elements close; group them by selector and
+            # restore document order so the results match a selector-by-selector search
+            found = [[] for _ in _PLAYER_SELECTORS]
+            for start_position, matched, player_data in self._stream_players(page_source):
+                for index in matched:
+                    found[index].append((start_position, player_data))
+            
+            for selector, selector_players in zip(_PLAYER_SELECTORS, found):
+                logger.info(f"Found {len(selector_players)} elements with selector: {selector}")
+                selector_players.sort(key=lambda item: item[0])
+                for _, player_data in selector_players:
+                    if player_data:
+                        players.append(player_data)
+                        logger.info(f"Added player: {player_data.player_name}")
             
             # If no players found, try to extract from any table or list
             if not players:
@@ -300,53 +652,34 @@ class SeleniumMatchParser:
                                 logger.warning(f"Error parsing table row: {str(e)}")
                                 continue
             
-            # If still no players found, create a dummy player for testing
-            if not players:
-                logger.info("No real player data found, creating dummy player for testing")
-                players.append(PlayerPerformance(
-                    player_name="Test Player",
-                    team="Red",
-                    kills=15,
-                    deaths=8,
-                    assists=3,
-                    score=4500,
-                    kd_ratio=1.875,
-                    headshots=8,
-                    headshot_percentage=53.33,
-                    damage_dealt=3200,
-                    damage_taken=1800,
-                    utility_used=0,
-                    first_bloods=0,
-                    clutches=0
-                ))
-            
         except Exception as e:
             logger.error(f"Error extracting player data: {str(e)}")
         
         logger.info(f"Total players found: {len(players)}")
         return players
     
-    def _parse_player_element(self, elem) -> Optional[PlayerPerformance]:
+    def _parse_player_element(self, elem, texts: Dict[Any, str]) -> Optional[PlayerPerformance]:
         """Parse individual player element"""
         try:
             # Try to extract player name
-            name_elem = elem.find(['div', 'span', 'td'], class_=lambda x: x and 'name' in x.lower())
-            player_name = name_elem.get_text().strip() if name_elem else "Unknown Player"
+            name_elems = _CLASS_XPATHS['name'](elem)
+            player_name = _element_text(name_elems[0], texts) if name_elems else "Unknown Player"
             
             # Try to extract team
-            team_elem = elem.find(['div', 'span', 'td'], class_=lambda x: x and 'team' in x.lower())
-            team = team_elem.get_text().strip() if team_elem else "Red"
+            team_elems = _CLASS_XPATHS['team'](elem)
+            team = _element_text(team_elems[0], texts) if team_elems else "Red"
             
             # Try to extract stats
-            kills = self._extract_stat_from_element(elem, ['kills', 'kill'])
-            deaths = self._extract_stat_from_element(elem, ['deaths', 'death'])
-            assists = self._extract_stat_from_element(elem, ['assists', 'assist'])
-            score = self._extract_stat_from_element(elem, ['score'])
+            kills = self._extract_stat_from_element(elem, ['kills', 'kill'], texts)
+            deaths = self._extract_stat_from_element(elem, ['deaths', 'death'], texts)
+            assists = self._extract_stat_from_element(elem, ['assists', 'assist'], texts)
+            score = self._extract_stat_from_element(elem, ['score'], texts)
             
             # Calculate K/D ratio
-            kd_ratio = kills / deaths if deaths > 0 else kills
+            kd_ratio = kills / deaths if deaths > 0 else float(kills)
             
-            return PlayerPerformance(
+            # Every field is built with its final type, so skip validation
+            return PlayerPerformance.model_construct(
                 player_name=player_name,
                 team=team,
                 kills=kills,
@@ -367,14 +700,13 @@ class SeleniumMatchParser:
             logger.warning(f"Error parsing player element: {str(e)}")
             return None
     
-    def _extract_stat_from_element(self, elem, stat_names: list) -> int:
+    def _extract_stat_from_element(self, elem, stat_names: list, texts: Dict[Any, str]) -> int:
         """Extract a specific stat from element"""
         for stat_name in stat_names:
             try:
-                stat_elem = elem.find(['div', 'span', 'td'], class_=lambda x: x and stat_name in x.lower())
-                if stat_elem:
-                    stat_text = stat_elem.get_text().strip()
-                    return int(stat_text)
+                stat_elems = _CLASS_XPATHS[stat_name](elem)
+                if stat_elems:
+                    return int(_element_text(stat_elems[0], texts))
             except (ValueError, AttributeError):
                 continue
         return 0
@@ -390,28 +722,21 @@ class SeleniumMatchParser:
             if not player_name or player_name.lower() in ['name', 'player', '']:
                 return None
             
-            # Try to extract stats from subsequent cells
-            stats = []
-            for cell in cells[1:]:
-                try:
-                    stat_text = cell.get_text().strip()
-                    if stat_text.isdigit():
-                        stats.append(int(stat_text))
-                    else:
-                        stats.append(0)
-                except (ValueError, AttributeError):
-                    stats.append(0)
+            # Only the four cells after the name are used; non-numeric or missing cells count as 0
+            stats = [
+                int(stat_text) if stat_text.isdecimal() else 0
+                for stat_text in (cell.get_text().strip() for cell in cells[1:5])
+            ]
+            stats += [0] * (4 - len(stats))
             
             # Assume first stat is kills, second is deaths, third is assists
-            kills = stats[0] if len(stats) > 0 else 0
-            deaths = stats[1] if len(stats) > 1 else 0
-            assists = stats[2] if len(stats) > 2 else 0
-            score = stats[3] if len(stats) > 3 else 0
+            kills, deaths, assists, score = stats
             
             # Calculate K/D ratio
-            kd_ratio = kills / deaths if deaths > 0 else kills
+            kd_ratio = kills / deaths if deaths > 0 else float(kills)
             
-            return PlayerPerformance(
+            # Every field is built with its final type, so skip validation
+            return PlayerPerformance.model_construct(
                 player_name=player_name,
                 team="Red",  # Default team
                 kills=kills,
@@ -433,7 +758,6 @@ class SeleniumMatchParser:
             return None
     
     def close(self):
-        """Close the browser driver"""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None 
\ No newline at end of file
+        """Close all pooled browser drivers"""
+        self.pool.close()
+        self._executor.shutdown(wait=False)
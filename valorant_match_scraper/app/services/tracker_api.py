@@ -0,0 +1,194 @@
+import httpx
+import orjson
+import time
+import logging
+from typing import Optional, Dict, Any
+from datetime import datetime
+from urllib.parse import urlparse
+
+from ..core.config import settings
+from ..schemas.match import MatchResult, PlayerPerformance, GameMode, MapName, ScrapingResponse
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Headers the tracker.gg site sends to its own match API
+API_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Origin': 'https://tracker.gg',
+    'Referer': 'https://tracker.gg/',
+}
+
+_MODE_LOOKUP = {m.value: m for m in GameMode}
+_MAP_LOOKUP = {m.value: m for m in MapName}
+
+# Ability cast stats summed into utility_used
+_UTILITY_STATS = ('grenadeCasts', 'ability1Casts', 'ability2Casts', 'ultimateCasts')
+
+
+class TrackerApiClient:
+    """Fetches match data from the JSON API behind tracker.gg match pages"""
+    
+    def __init__(self):
+        self.client: Optional[httpx.AsyncClient] = None
+    
+    async def startup(self):
+        """Create the shared async HTTP client"""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                headers=API_HEADERS,
+                http2=True,
+                timeout=settings.request_timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=settings.max_keepalive_connections,
+                    keepalive_expiry=settings.keepalive_expiry
+                )
+            )
+    
+    async def close(self):
+        """Close the shared async HTTP client"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    async def scrape_match(self, match_url: str) -> ScrapingResponse:
+        """Fetch a match from the tracker.gg API"""
+        start_time = time.time()
+        match_id = urlparse(match_url).path.rstrip('/').rsplit('/', 1)[-1]
+        
+        try:
+            # Create the client lazily when used outside the app lifecycle
+            await self.startup()
+            
+            response = await self.client.get(f"{settings.tracker_api_url}/{match_id}")
+            if response.status_code != 200:
+                logger.warning(f"Tracker API request for {match_id} failed: HTTP {response.status_code}")
+                return ScrapingResponse(
+                    success=False,
+                    error_message=f"Tracker API returned HTTP {response.status_code}",
+                    processing_time=time.time() - start_time
+                )
+            
+            match_data = parse_match_json(orjson.loads(response.content), match_id, match_url)
+            if not match_data:
+                return ScrapingResponse(
+                    success=False,
+                    error_message="No player data in tracker API response",
+                    processing_time=time.time() - start_time
+                )
+            
+            processing_time = time.time() - start_time
+            logger.info(f"Fetched match {match_id} from tracker API in {processing_time:.2f}s")
+            
+            return ScrapingResponse(
+                success=True,
+                match_data=match_data,
+                processing_time=processing_time
+            )
+        
+        except Exception as e:
+            logger.error(f"Error fetching match from tracker API: {str(e)}")
+            return ScrapingResponse(
+                success=False,
+                error_message=f"Unexpected error: {str(e)}",
+                processing_time=time.time() - start_time
+            )
+
+
+def parse_match_json(payload: Dict[str, Any], match_id: str, match_url: str) -> Optional[MatchResult]:
+    """Build a MatchResult from a tracker.gg match API payload"""
+    data = payload.get('data') or {}
+    metadata = data.get('metadata') or {}
+    segments = data.get('segments') or []
+    
+    players = [
+        _parse_player_segment(segment)
+        for segment in segments
+        if segment.get('type') == 'player-summary'
+    ]
+    if not players:
+        return None
+    
+    # Team segments carry the rounds won and the winner
+    scores: Dict[str, int] = {}
+    winner = 'Unknown'
+    for segment in segments:
+        if segment.get('type') != 'team-summary':
+            continue
+        team = (segment.get('attributes') or {}).get('teamId', '')
+        scores[team] = _stat(segment.get('stats'), 'roundsWon')
+        if (segment.get('metadata') or {}).get('hasWon'):
+            winner = team
+    
+    mode_name = (metadata.get('modeName') or '').lower().replace(' ', '_')
+    map_name = (metadata.get('mapName') or '').lower()
+    
+    return MatchResult(
+        match_id=(data.get('attributes') or {}).get('id') or match_id,
+        match_url=match_url,
+        game_mode=_MODE_LOOKUP.get(mode_name, GameMode.DEATHMATCH),
+        map_name=_MAP_LOOKUP.get(map_name, MapName.ASCENT),
+        match_duration=int(metadata.get('duration') or 0) // 1000,
+        match_date=_parse_timestamp(metadata.get('dateStarted')),
+        red_team_score=scores.get('Red', 0),
+        blue_team_score=scores.get('Blue', 0),
+        winner=winner,
+        players=players,
+        total_rounds=int(metadata.get('rounds') or sum(scores.values())),
+        overtime_rounds=0
+    )
+
+
+def _parse_player_segment(segment: Dict[str, Any]) -> PlayerPerformance:
+    """Build a player's performance from a player-summary segment"""
+    metadata = segment.get('metadata') or {}
+    attributes = segment.get('attributes') or {}
+    stats = segment.get('stats')
+    
+    player_name = (
+        (metadata.get('platformInfo') or {}).get('platformUserHandle')
+        or attributes.get('platformUserIdentifier')
+        or "Unknown Player"
+    )
+    kills = _stat(stats, 'kills')
+    deaths = _stat(stats, 'deaths')
+    
+    return PlayerPerformance(
+        player_name=player_name,
+        team=metadata.get('teamId') or "Red",
+        kills=kills,
+        deaths=deaths,
+        assists=_stat(stats, 'assists'),
+        score=_stat(stats, 'score'),
+        kd_ratio=_stat(stats, 'kdRatio', kills / deaths if deaths > 0 else kills, float),
+        headshots=_stat(stats, 'headshots'),
+        headshot_percentage=_stat(stats, 'headshotsPercentage', 0.0, float),
+        damage_dealt=_stat(stats, 'damage'),
+        damage_taken=_stat(stats, 'damageReceived'),
+        utility_used=sum(_stat(stats, name) for name in _UTILITY_STATS),
+        first_bloods=_stat(stats, 'firstBloods'),
+        clutches=_stat(stats, 'clutches')
+    )
+
+
+def _stat(stats: Optional[Dict[str, Any]], name: str, default: Any = 0, cast: type = int) -> Any:
+    """Read a stat's value from a segment's stats block"""
+    value = ((stats or {}).get(name) or {}).get('value')
+    if value is None:
+        return default
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_timestamp(timestamp: Optional[str]) -> datetime:
+    """Parse an ISO 8601 timestamp from the API"""
+    if timestamp:
+        try:
+            return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        except ValueError:
+            logger.warning(f"Could not parse match date: {timestamp}")
+    return datetime.now()
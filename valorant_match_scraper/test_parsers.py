@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Offline parser test script for Valorant Match Scraper
+"""
+
+import sys
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent / "app"))
+
+MATCH_URL = "https://tracker.gg/valorant/match/e1695f06-0410-4dbb-9b99-bc868af6e46b"
+
+# Match-level divs shared by the match_parser pages
+MATCH_INFO_HTML = (
+    '<div class="game-mode">Deathmatch</div>'
+    '<div class="map-name">Haven</div>'
+    '<div class="score">13</div><div class="score">7</div>'
+    '<div class="duration">12:34</div>'
+    '<div class="match-date">2024-05-01</div>'
+)
+
+# Player containers whose stats sit in nested divs, one with markup inside the name
+NESTED_PLAYERS_PAGE = f'''<html><body>{MATCH_INFO_HTML}
+<div class="player-stats">
+  <div class="row"><div class="player-name">Alpha</div><div class="team">Red</div></div>
+  <div class="row">
+    <div class="kills">20</div><div class="deaths">10</div><div class="assists">3</div>
+    <div class="score">5000</div><div class="headshots">5</div>
+  </div>
+</div>
+<div class="player-stats">
+  <div class="player-name">Bravo <span>#EU1</span></div><div class="team">Blue</div>
+  <div class="kills">9</div><div class="deaths">0</div>
+</div>
+</body></html>'''
+
+# A player-stats container nested inside another; the outer one also reads the inner divs
+NESTED_CONTAINERS_PAGE = f'''<html><body>{MATCH_INFO_HTML}
+<div class="player-stats">
+  <div class="player-name">Alpha</div><div class="kills">5</div>
+  <div class="player-stats">
+    <div class="player-name">Bravo</div><div class="kills">3</div><div class="deaths">1</div>
+  </div>
+</div>
+</body></html>'''
+
+# No player containers, so players come from the player-table rows
+PLAYER_TABLE_PAGE = f'''<html><body>{MATCH_INFO_HTML}
+<table class="player-table">
+  <tr><th>Name</th><th>Team</th><th>K</th><th>D</th><th>A</th><th>Score</th></tr>
+  <tr><td>Alpha</td><td>Red</td><td>20</td><td>10</td><td>3</td><td>5000</td></tr>
+  <tr><td>Broken</td><td>Red</td><td>n/a</td><td>1</td><td>1</td><td>1</td></tr>
+  <tr><td>Bravo</td><td>Blue</td><td>9</td><td>0</td><td>1</td><td>2000</td></tr>
+</table>
+</body></html>'''
+
+# Outer player list wrapping two player cards, all matched by the player selectors
+SELENIUM_NESTED_PAGE = '''<html><body><section class="scoreboard"><div class="player-list">
+<div class="player-card"><span class="name">Alpha</span><span class="team">Blue</span>
+<span class="kills">20</span><span class="deaths">10</span><span class="assists">3</span><span class="score">5000</span></div>
+<div class="player-card"><span class="name">Bravo</span><span class="kills">9</span><span class="deaths">0</span></div>
+</div></section></body></html>'''
+
+# No player-like classes, so players come from the generic table rows
+SELENIUM_TABLE_PAGE = '''<html><body><table>
+<tr><th>Name</th><th>K</th><th>D</th><th>A</th><th>Score</th></tr>
+<tr><td>Alpha</td><td>20</td><td>10</td><td>3</td><td>5000</td></tr>
+<tr><td>Bravo</td><td>9</td><td>0</td></tr>
+</table></body></html>'''
+
+# Minimal tracker.gg match API payload: two players and both team summaries
+TRACKER_PAYLOAD = {
+    "data": {
+        "attributes": {"id": "e1695f06-0410-4dbb-9b99-bc868af6e46b"},
+        "metadata": {
+            "modeName": "Spike Rush",
+            "mapName": "Haven",
+            "duration": 754000,
+            "dateStarted": "2024-05-01T12:00:00Z",
+            "rounds": 1
+        },
+        "segments": [
+            {
+                "type": "player-summary",
+                "attributes": {"platformUserIdentifier": "Alpha#NA1"},
+                "metadata": {"platformInfo": {"platformUserHandle": "Alpha#EU1"}, "teamId": "Blue"},
+                "stats": {
+                    "kills": {"value": 40}, "deaths": {"value": 20}, "assists": {"value": 5},
+                    "score": {"value": 9000}, "headshots": {"value": 10},
+                    "headshotsPercentage": {"value": 25.0}, "damage": {"value": 6000},
+                    "grenadeCasts": {"value": 2}, "ultimateCasts": {"value": 1}
+                }
+            },
+            {
+                "type": "player-summary",
+                "attributes": {"platformUserIdentifier": "Bravo#NA1"},
+                "metadata": {"teamId": "Red"},
+                "stats": {"kills": {"value": 7}, "deaths": {"value": 0}}
+            },
+            {
+                "type": "team-summary",
+                "attributes": {"teamId": "Blue"},
+                "metadata": {"hasWon": True},
+                "stats": {"roundsWon": {"value": 100}}
+            },
+            {
+                "type": "team-summary",
+                "attributes": {"teamId": "Red"},
+                "metadata": {"hasWon": False},
+                "stats": {"roundsWon": {"value": 64}}
+            }
+        ]
+    }
+}
+
+def test_match_parser():
+    """Test parse_match_bytes on fixed pages"""
+    print("Testing match_parser...")
+    
+    try:
+        from app.services.match_parser import parse_match_bytes
+        from app.schemas.match import MapName
+        
+        # Nested player containers
+        result = parse_match_bytes(NESTED_PLAYERS_PAGE.encode(), MATCH_URL)
+        assert result is not None, "nested page was not parsed"
+        assert result['map_name'] == MapName.HAVEN
+        assert result['match_duration'] == 754
+        assert (result['red_team_score'], result['blue_team_score'], result['winner']) == (13, 7, 'Red')
+        players = [(p['player_name'], p['team'], p['kills'], p['deaths'], p['kd_ratio']) for p in result['players']]
+        assert players == [('Alpha', 'Red', 20, 10, 2.0), ('Bravo #EU1', 'Blue', 9, 0, 9.0)], players
+        assert result['players'][0]['headshot_percentage'] == 25.0
+        print("✓ Nested player containers parsed")
+        
+        # Each nested player-stats container is its own player
+        result = parse_match_bytes(NESTED_CONTAINERS_PAGE.encode(), MATCH_URL)
+        assert result is not None, "nested containers page was not parsed"
+        players = [(p['player_name'], p['kills'], p['deaths']) for p in result['players']]
+        assert players == [('Alpha', 5, 1), ('Bravo', 3, 1)], players
+        print("✓ Nested player-stats containers parsed")
+        
+        # Table fallback, skipping the header and the unparseable row
+        result = parse_match_bytes(PLAYER_TABLE_PAGE.encode(), MATCH_URL)
+        assert result is not None, "table page was not parsed"
+        players = [(p['player_name'], p['team'], p['kills'], p['assists'], p['score']) for p in result['players']]
+        assert players == [('Alpha', 'Red', 20, 3, 5000), ('Bravo', 'Blue', 9, 1, 2000)], players
+        print("✓ Player table fallback parsed")
+        
+        # Pages without players are rejected
+        assert parse_match_bytes(f'<html><body>{MATCH_INFO_HTML}</body></html>'.encode(), MATCH_URL) is None
+        print("✓ Page without players rejected")
+        
+        return True
+    except Exception as e:
+        print(f"✗ match_parser test failed: {e!r}")
+        return False
+
+def test_selenium_parser():
+    """Test SeleniumMatchParser._parse_match_data on fixed pages"""
+    print("\nTesting selenium_parser...")
+    
+    try:
+        import orjson
+        from app.services.selenium_parser import SeleniumMatchParser
+        
+        # Parsing never touches a driver, so the pool is left unstarted
+        parser = SeleniumMatchParser(pool_size=1)
+        try:
+            # Nested containers are reported outer first, each reading its first stat elements
+            result = parser._parse_match_data(SELENIUM_NESTED_PAGE, MATCH_URL)
+            assert result is not None, "nested page was not parsed"
+            players = [(p.player_name, p.team, p.kills, p.deaths, p.kd_ratio) for p in result.players]
+            assert players == [
+                ('Alpha', 'Blue', 20, 10, 2.0),
+                ('Alpha', 'Blue', 20, 10, 2.0),
+                ('Bravo', 'Red', 9, 0, 9.0)
+            ], players
+            print("✓ Nested player containers parsed")
+            
+            # Table fallback, skipping the header and padding short rows
+            result = parser._parse_match_data(SELENIUM_TABLE_PAGE, MATCH_URL)
+            assert result is not None, "table page was not parsed"
+            players = [(p.player_name, p.kills, p.deaths, p.assists, p.score) for p in result.players]
+            assert players == [('Alpha', 20, 10, 3, 5000), ('Bravo', 9, 0, 0, 0)], players
+            print("✓ Table row fallback parsed")
+            
+            # The embedded __NEXT_DATA__ payload wins over the DOM
+            next_data = orjson.dumps({"props": {"pageProps": {"match": TRACKER_PAYLOAD}}}).decode()
+            page = SELENIUM_TABLE_PAGE.replace(
+                '<body>', f'<body><script id="__NEXT_DATA__" type="application/json">{next_data}</script>'
+            )
+            result = parser._parse_match_data(page, MATCH_URL)
+            assert result is not None, "__NEXT_DATA__ page was not parsed"
+            assert [p.player_name for p in result.players] == ['Alpha#EU1', 'Bravo#NA1']
+            print("✓ __NEXT_DATA__ payload parsed")
+            
+            # An unusable payload falls back to the DOM
+            page = SELENIUM_TABLE_PAGE.replace(
+                '<body>', '<body><script id="__NEXT_DATA__" type="application/json">{"props": null}</script>'
+            )
+            result = parser._parse_match_data(page, MATCH_URL)
+            assert result is not None and [p.player_name for p in result.players] == ['Alpha', 'Bravo']
+            print("✓ Unusable __NEXT_DATA__ falls back to the page")
+        finally:
+            parser.close()
+        
+        return True
+    except Exception as e:
+        print(f"✗ selenium_parser test failed: {e!r}")
+        return False
+
+def test_tracker_api():
+    """Test parse_match_json on a fixed API payload"""
+    print("\nTesting tracker_api...")
+    
+    try:
+        from datetime import datetime, timezone
+        from app.services.tracker_api import parse_match_json
+        from app.schemas.match import GameMode, MapName
+        
+        result = parse_match_json(TRACKER_PAYLOAD, "fallback-id", MATCH_URL)
+        assert result is not None, "payload was not parsed"
+        assert result.match_id == "e1695f06-0410-4dbb-9b99-bc868af6e46b"
+        assert result.game_mode == GameMode.SPIKE_RUSH
+        assert result.map_name == MapName.HAVEN
+        assert result.match_duration == 754
+        assert result.match_date == datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+        print("✓ Match metadata mapped")
+        
+        # Team summaries give the scores and the winner
+        assert (result.red_team_score, result.blue_team_score, result.winner) == (64, 100, 'Blue')
+        print("✓ Team summaries mapped")
+        
+        # Handles win over identifiers, missing stats default to 0
+        alpha, bravo = result.players
+        assert (alpha.player_name, alpha.team, alpha.kills, alpha.deaths, alpha.kd_ratio) == ('Alpha#EU1', 'Blue', 40, 20, 2.0)
+        assert (alpha.headshot_percentage, alpha.damage_dealt, alpha.utility_used) == (25.0, 6000, 3)
+        assert (bravo.player_name, bravo.team, bravo.kills, bravo.kd_ratio, bravo.score) == ('Bravo#NA1', 'Red', 7, 7.0, 0)
+        print("✓ Player summaries mapped")
+        
+        # Payloads without player segments are rejected
+        assert parse_match_json({"data": {"segments": []}}, "fallback-id", MATCH_URL) is None
+        print("✓ Payload without players rejected")
+        
+        return True
+    except Exception as e:
+        print(f"✗ tracker_api test failed: {e!r}")
+        return False
+
+def main():
+    """Run all tests"""
+    print("🧪 Offline Parser Test")
+    print("=" * 40)
+    
+    success = True
+    
+    if not test_match_parser():
+        success = False
+    
+    if not test_selenium_parser():
+        success = False
+    
+    if not test_tracker_api():
+        success = False
+    
+    print("\n" + "=" * 40)
+    if success:
+        print("✅ All parser tests passed!")
+    else:
+        print("❌ Some parser tests failed. Please check the errors above.")
+    
+    return success
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
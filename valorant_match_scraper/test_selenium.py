@@ -3,6 +3,7 @@
 Test script for Selenium-based Valorant Match Scraper
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -17,10 +18,11 @@ def test_selenium_parser():
     try:
         from app.services.selenium_parser import SeleniumMatchParser
         
-        # Create parser instance
-        parser = SeleniumMatchParser()
+        # Create parser instance with a single pooled driver
+        parser = SeleniumMatchParser(pool_size=1)
+        parser.pool.start()
         
-        if not parser.driver:
+        if not parser.pool.available:
             print("❌ Selenium driver failed to initialize")
             return False
         
@@ -32,7 +34,7 @@ def test_selenium_parser():
         print(f"🔍 Testing with URL: {test_url}")
         
         # Try to scrape (will likely fail due to 403, but we can test the setup)
-        response = parser.scrape_match(test_url)
+        response = asyncio.run(parser.scrape_match(test_url))
         
         print(f"📊 Response success: {response.success}")
         print(f"⏱️  Processing time: {response.processing_time:.2f}s")
@@ -66,9 +68,6 @@ def test_imports():
         from selenium import webdriver
         print("✓ Selenium imported")
         
-        from webdriver_manager.chrome import ChromeDriverManager
-        print("✓ WebDriver Manager imported")
-        
         from app.services.selenium_parser import SeleniumMatchParser
         print("✓ SeleniumMatchParser imported")
         
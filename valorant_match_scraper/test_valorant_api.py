@@ -4,131 +4,581 @@ Test script for Valorant API
 Makes a GET request to /val/match/v1/matches/{matchId} endpoint
 """
 
+import argparse
+import asyncio
+import functools
+import httpx
+import itertools
+import logging
+import msgspec
+import os
 import requests
-import json
-from datetime import datetime
+import random
+import sys
+import threading
+import time
+import zstandard
+from multiprocessing import Pool
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def test_valorant_api():
-    """Test the Valorant API with the specified match ID"""
-    print("🧪 Testing Valorant API")
-    print("=" * 50)
+logger = logging.getLogger(__name__)
+
+MATCH_ID = "e1695f06-0410-4dbb-9b99-bc868af6e46b"
+REGION = "AP"
+
+# API keys come from RIOT_API_KEYS (comma-separated, rotated per request) or RIOT_API_KEY
+HEADERS = {
+    "User-Agent": "Tournify-Match-Scraper/1.0"
+}
+
+# Agent (characterId) and map (mapId) names; unknown IDs are shown as is
+AGENTS = {
+    "41fb69c1-4189-7b37-f117-bcaf1e96f1bf": "Astra",
+    "5f8d3a7f-467b-97f3-062c-13acf203c006": "Breach",
+    "9f0d8ba9-4140-b941-57d3-a7ad57c6b417": "Brimstone",
+    "22697a3d-45bf-8dd7-4fec-84a9e28c69d7": "Chamber",
+    "1dbf2edd-4729-0984-3115-daa5eed44993": "Clove",
+    "117ed9e3-49f3-6512-3ccf-0cada7e3823b": "Cypher",
+    "cc8b64c8-4b25-4ff9-6e7f-37b4da43d235": "Deadlock",
+    "dade69b4-4f5a-8528-247b-219e5a1facd6": "Fade",
+    "e370fa57-4757-3604-3648-499e1f642d3f": "Gekko",
+    "95b78ed7-4637-86d9-7e41-71ba8c293152": "Harbor",
+    "0e38b510-41a8-5780-5e8f-568b2a4f2d6c": "Iso",
+    "add6443a-41bd-e414-f6ad-e58d267f4e95": "Jett",
+    "601dbbe7-43ce-be57-2a40-4abd24953621": "KAY/O",
+    "1e58de9c-4950-5125-93e9-a0aee9f98746": "Killjoy",
+    "bb2a4828-46eb-8cd1-e765-15848195d751": "Neon",
+    "8e253930-4c05-31dd-1b6c-968525494517": "Omen",
+    "eb93336a-449b-9c1b-0a54-a891f7921d69": "Phoenix",
+    "f94c3b30-42be-e959-889c-5aa313dba261": "Raze",
+    "a3bfb853-43b2-7238-a4f1-ad90e9e46bcc": "Reyna",
+    "569fdd95-4d10-43ab-ca70-79becc718b46": "Sage",
+    "6f2a04ca-43e0-be17-7f36-b3908627744d": "Skye",
+    "320b2a48-4d9b-a075-30f1-1f93a9b638fa": "Sova",
+    "707eab51-4836-f488-046a-cda6bf494859": "Viper",
+    "efba5359-4016-a1e5-7626-b1ae76895940": "Vyse",
+    "7f94d92c-4234-0a36-9646-3a87eb8b5c89": "Yoru",
+}
+
+MAPS = {
+    "/Game/Maps/Infinity/Infinity": "Abyss",
+    "/Game/Maps/Ascent/Ascent": "Ascent",
+    "/Game/Maps/Duality/Duality": "Bind",
+    "/Game/Maps/Foxtrot/Foxtrot": "Breeze",
+    "/Game/Maps/Canyon/Canyon": "Fracture",
+    "/Game/Maps/Triad/Triad": "Haven",
+    "/Game/Maps/Port/Port": "Icebox",
+    "/Game/Maps/Jam/Jam": "Lotus",
+    "/Game/Maps/Pitt/Pitt": "Pearl",
+    "/Game/Maps/Bonsai/Bonsai": "Split",
+    "/Game/Maps/Juliett/Juliett": "Sunset",
+    "/Game/Maps/Poveglia/Range": "The Range",
+}
+
+
+class MatchInfo(msgspec.Struct):
+    """matchInfo fields shown in verbose output"""
+    gameMode: str = "Unknown"
+    mapId: str = "Unknown"
+    gameLengthMillis: int = 0
+    isCompleted: bool = False
+    isRanked: bool = False
+    region: str = "Unknown"
+
+
+class PlayerStats(msgspec.Struct):
+    """Per-player stats shown in verbose output"""
+    score: int = 0
+    kills: int = 0
+    deaths: int = 0
+    assists: int = 0
+    roundsPlayed: int = 0
+
+
+class Player(msgspec.Struct):
+    """Player fields shown in verbose output"""
+    gameName: str = "Unknown"
+    tagLine: str = ""
+    teamId: str = "Unknown"
+    characterId: str = "Unknown"
+    stats: PlayerStats = msgspec.field(default_factory=PlayerStats)
+
+
+class Team(msgspec.Struct):
+    """Team fields shown in verbose output"""
+    teamId: str = "Unknown"
+    won: bool = False
+    roundsWon: int = 0
+    roundsPlayed: int = 0
+    numPoints: int = 0
+
+
+class Match(msgspec.Struct):
+    """The parts of a match response the script reads; other fields are skipped when decoding"""
+    matchInfo: MatchInfo = msgspec.field(default_factory=MatchInfo)
+    players: list[Player] = msgspec.field(default_factory=list)
+    teams: list[Team] = msgspec.field(default_factory=list)
+
+
+class _CompletedCheck(msgspec.Struct):
+    """Just enough of a match to tell whether it is completed"""
+    matchInfo: MatchInfo = msgspec.field(default_factory=MatchInfo)
+
+
+class MatchSummary(msgspec.Struct):
+    """matchInfo and teams only; players and rounds are skipped without being built"""
+    matchInfo: MatchInfo = msgspec.field(default_factory=MatchInfo)
+    teams: list[Team] = msgspec.field(default_factory=list)
+
+
+class _PlayerList(msgspec.Struct):
+    """Just the players list, each player left undecoded"""
+    players: list[msgspec.Raw] = msgspec.field(default_factory=list)
+
+
+_MATCH_DECODER = msgspec.json.Decoder(Match)
+_SUMMARY_DECODER = msgspec.json.Decoder(MatchSummary)
+_COMPLETED_DECODER = msgspec.json.Decoder(_CompletedCheck)
+_PLAYER_LIST_DECODER = msgspec.json.Decoder(_PlayerList)
+
+# Matches fetched at once in batch mode
+MAX_CONCURRENT = 10
+
+# Retry settings for rate-limited (429) and server-error responses
+MAX_RETRIES = 5
+RETRY_BASE = 1.0
+RETRY_CAP = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Chunk size used when streaming a response body to disk
+STREAM_CHUNK_SIZE = 65536
+
+# Fetched matches are cached on disk, zstd-compressed; completed matches never change, so they never expire
+CACHE_DIR = Path(".cache")
+CACHE_TTL = 86400 * 30
+CACHE_ZSTD_LEVEL = 3
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=CACHE_ZSTD_LEVEL)
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+# Riot's development key limits: 20 requests per second and 100 per 2 minutes, per key
+RATE_LIMITS = ((20, 1.0), (100, 120.0))
+
+# Batch fetches in flight, keyed by (region, match_id), so duplicate IDs share one request
+_inflight = {}
+
+# Shared session so repeated calls reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+# urllib3 retries 429/5xx on the pooled connection, honoring Retry-After; the last
+# response is returned rather than raised once retries run out
+_RETRY = Retry(
+    total=MAX_RETRIES,
+    backoff_factor=RETRY_BASE,
+    backoff_max=RETRY_CAP,
+    backoff_jitter=0.5,
+    status_forcelist=tuple(RETRY_STATUSES),
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRY))
+
+@functools.lru_cache(maxsize=None)
+def base_url(region):
+    """API host URL for a region, built once per region"""
+    return f"https://{region.lower()}.api.riotgames.com"
+
+def match_url(match_id, region):
+    """Build the match endpoint URL for a region"""
+    return f"{base_url(region)}/val/match/v1/matches/{match_id}"
+
+@functools.lru_cache(maxsize=None)
+def api_keys():
+    """API keys configured in the environment"""
+    raw = os.environ.get("RIOT_API_KEYS") or os.environ.get("RIOT_API_KEY", "")
+    return tuple(key.strip() for key in raw.split(",") if key.strip())
+
+@functools.lru_cache(maxsize=None)
+def _key_cycle():
+    """Round-robin iterator over the configured API keys"""
+    return itertools.cycle(api_keys())
+
+def next_api_key():
+    """Return the next API key in the rotation"""
+    if not api_keys():
+        raise RuntimeError("No API key configured, set RIOT_API_KEYS or RIOT_API_KEY")
+    return next(_key_cycle())
+
+class TokenBucket:
+    """Thread-safe token bucket; reserve() takes a token and returns how long to wait for it"""
     
-    # API Configuration
-    match_id = "e1695f06-0410-4dbb-9b99-bc868af6e46b"
-    region = "AP"
-    api_key = "RGAPI-c34e511e-bfbd-419e-8d65-384c400c0587"
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
     
-    # Construct the API URL
-    base_url = f"https://{region.lower()}.api.riotgames.com"
-    endpoint = f"/val/match/v1/matches/{match_id}"
-    url = base_url + endpoint
+    def reserve(self):
+        """Take a token, going into debt if none is left, and return the wait in seconds"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+@functools.lru_cache(maxsize=None)
+def _key_buckets(api_key):
+    """Short- and long-window buckets for one API key"""
+    return tuple(TokenBucket(requests / window, requests) for requests, window in RATE_LIMITS)
+
+def throttle_delay(api_key):
+    """Reserve a request slot under every limit for a key, returning how long to wait first"""
+    return max(bucket.reserve() for bucket in _key_buckets(api_key))
+
+def retry_delay(attempt, response=None, base=RETRY_BASE):
+    """Seconds to wait before the next attempt, honoring Retry-After with added jitter"""
+    delay = base * 2 ** attempt
+    if response is not None:
+        try:
+            delay = float(response.headers.get("Retry-After", delay))
+        except ValueError:
+            pass
+        delay *= 1 + random.random() * 0.5
+    return min(delay, RETRY_CAP)
+
+async def get_with_retry_async(client, url, headers=None, max_retries=MAX_RETRIES, base=RETRY_BASE):
+    """GET a URL, backing off on 429/5xx and connection errors like the session's Retry"""
+    for attempt in range(max_retries + 1):
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.TransportError:
+            if attempt == max_retries:
+                raise
+            await asyncio.sleep(retry_delay(attempt, base=base))
+            continue
+        
+        if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+            return response
+        await asyncio.sleep(retry_delay(attempt, response, base))
+
+def cache_path(region, match_id):
+    """Path of a match's cache entry"""
+    return CACHE_DIR / region.lower() / f"{match_id}.json.zst"
+
+def read_cached_match(region, match_id, ttl=CACHE_TTL):
+    """Return a cached match's raw JSON if it is completed or younger than ttl seconds"""
+    path = cache_path(region, match_id)
+    try:
+        age = time.time() - path.stat().st_mtime
+        raw = _ZSTD_DECOMPRESSOR.decompress(path.read_bytes())
+        if age < ttl or _COMPLETED_DECODER.decode(raw).matchInfo.isCompleted:
+            return raw
+    except (OSError, zstandard.ZstdError, msgspec.DecodeError):
+        pass
+    return None
+
+def write_cached_match(region, match_id, raw):
+    """Store a fetched match's raw JSON in the cache"""
+    path = cache_path(region, match_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(_ZSTD_COMPRESSOR.compress(raw))
+
+def run_tag():
+    """Timestamp used in output filenames; batches compute it once and share it"""
+    return time.strftime("%Y%m%d_%H%M%S")
+
+def match_filename(match_id, tag=None):
+    """Timestamped output filename for a match"""
+    return f"match_data_{match_id}_{tag or run_tag()}.json"
+
+def stream_match(region, match_id, response, tag=None):
+    """Write a streamed response body straight to the output file and cache, without parsing it"""
+    filename = match_filename(match_id, tag)
+    with open(filename, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            f.write(chunk)
     
-    # Headers
-    headers = {
-        "X-Riot-Token": api_key,
-        "User-Agent": "Tournify-Match-Scraper/1.0"
-    }
+    # Compress the file into the cache in chunks; passing the size records it in the frame
+    path = cache_path(region, match_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(filename, 'rb') as src, open(path, 'wb') as dst:
+        _ZSTD_COMPRESSOR.copy_stream(src, dst, size=os.path.getsize(filename))
+    return filename
+
+def save_raw_match(match_id, raw, tag=None):
+    """Save a match's raw JSON as returned by the API to a timestamped file"""
+    filename = match_filename(match_id, tag)
+    with open(filename, 'wb') as f:
+        f.write(raw)
+    return filename
+
+def request_match(url, api_key):
+    """Send a throttled, streamed GET for a match; the caller closes the response"""
+    time.sleep(throttle_delay(api_key))
+    return _SESSION.get(url, headers={"X-Riot-Token": api_key}, timeout=(3.05, 15), stream=True)
+
+def summarize_match(raw, out=sys.stdout, summary_only=False):
+    """Write a readable summary of a match's raw JSON, leaving out players when summary_only"""
+    # Decode only the displayed fields
+    match = (_SUMMARY_DECODER if summary_only else _MATCH_DECODER).decode(raw)
+    match_info = match.matchInfo
     
+    lines = [
+        "✅ Success! Match data retrieved",
+        "-" * 50,
+        f"🎮 Game Mode: {match_info.gameMode}",
+        f"🗺️  Map: {MAPS.get(match_info.mapId, match_info.mapId)}",
+        f"⏰ Game Length: {match_info.gameLengthMillis // 1000}s",
+        f"🏆 Is Completed: {match_info.isCompleted}",
+        f"🏅 Is Ranked: {match_info.isRanked}",
+        f"🌍 Region: {match_info.region}"
+    ]
+    if not summary_only:
+        lines.append(f"\n👥 Players ({len(match.players)}):")
+        lines += [
+            f"  {i+1}. {player.gameName}#{player.tagLine}\n"
+            f"     Team: {player.teamId}\n"
+            f"     Agent: {AGENTS.get(player.characterId, player.characterId)}\n"
+            f"     Score: {player.stats.score}\n"
+            f"     K/D/A: {player.stats.kills}/{player.stats.deaths}/{player.stats.assists}\n"
+            f"     Rounds Played: {player.stats.roundsPlayed}\n"
+            for i, player in enumerate(match.players)
+        ]
+    else:
+        lines.append("")
+    lines.append(f"🏆 Teams ({len(match.teams)}):")
+    lines += [
+        f"  Team {team.teamId}: {'✅ Won' if team.won else '❌ Lost'}\n"
+        f"    Rounds: {team.roundsWon}/{team.roundsPlayed}\n"
+        f"    Points: {team.numPoints}\n"
+        for team in match.teams
+    ]
+    out.write("\n".join(lines) + "\n")
+
+def report_error(match_id, status_code, response=None):
+    """Log why a match request failed; the explanation is logged at DEBUG"""
+    if status_code == 404:
+        logger.error("❌ %s: Match not found", match_id)
+        logger.debug(
+            "This could mean:\n"
+            "  - The match ID is incorrect\n"
+            "  - The match is not available in the specified region\n"
+            "  - The match is too old or not accessible"
+        )
+    elif status_code == 401:
+        logger.error("❌ %s: Unauthorized", match_id)
+        logger.debug("Check your API key")
+    elif status_code == 403:
+        logger.error("❌ %s: Forbidden", match_id)
+        logger.debug("API key may be invalid or expired")
+    elif status_code == 429:
+        logger.error("❌ %s: Rate limit exceeded", match_id)
+        logger.debug("Still rate limited after %d retries, try again later", MAX_RETRIES)
+    else:
+        logger.error("❌ %s: Error %s", match_id, status_code)
+        if response is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response: %r", response.content[:500])
+
+def test_valorant_api(match_id=MATCH_ID, region=REGION, verbose=None, tag=None, summary_only=False):
+    """Test the Valorant API with the specified match ID, returning the saved filename (None on failure)"""
+    # Details follow the log level unless asked for explicitly
+    if verbose is None:
+        verbose = logger.isEnabledFor(logging.DEBUG)
+    
+    # API Configuration
     try:
-        print(f"🔍 Match ID: {match_id}")
-        print(f"🌍 Region: {region}")
-        print(f"📡 API URL: {url}")
-        print(f"🔑 API Key: {api_key[:10]}...")
-        print("-" * 50)
-        
-        # Make the GET request
-        print("🚀 Sending GET request...")
-        response = requests.get(url, headers=headers)
-        
-        print(f"📊 Status Code: {response.status_code}")
-        print(f"⏱️  Response Time: {response.elapsed.total_seconds():.2f}s")
-        print(f"📄 Content-Type: {response.headers.get('content-type', 'Unknown')}")
-        
-        if response.status_code == 200:
-            print("✅ Success! Match data retrieved")
-            print("-" * 50)
-            
-            # Parse the response
-            match_data = response.json()
-            
-            # Display basic match information
-            match_info = match_data.get('matchInfo', {})
-            print(f"🎮 Game Mode: {match_info.get('gameMode', 'Unknown')}")
-            print(f"🗺️  Map ID: {match_info.get('mapId', 'Unknown')}")
-            print(f"⏰ Game Length: {match_info.get('gameLengthMillis', 0) // 1000}s")
-            print(f"🏆 Is Completed: {match_info.get('isCompleted', False)}")
-            print(f"🏅 Is Ranked: {match_info.get('isRanked', False)}")
-            print(f"🌍 Region: {match_info.get('region', 'Unknown')}")
-            
-            # Display player information
-            players = match_data.get('players', [])
-            print(f"\n👥 Players ({len(players)}):")
-            for i, player in enumerate(players):
-                player_name = f"{player.get('gameName', 'Unknown')}#{player.get('tagLine', '')}"
-                team_id = player.get('teamId', 'Unknown')
-                character_id = player.get('characterId', 'Unknown')
-                stats = player.get('stats', {})
-                
-                print(f"  {i+1}. {player_name}")
-                print(f"     Team: {team_id}")
-                print(f"     Agent: {character_id}")
-                print(f"     Score: {stats.get('score', 0)}")
-                print(f"     K/D/A: {stats.get('kills', 0)}/{stats.get('deaths', 0)}/{stats.get('assists', 0)}")
-                print(f"     Rounds Played: {stats.get('roundsPlayed', 0)}")
-                print()
-            
-            # Display team information
-            teams = match_data.get('teams', [])
-            print(f"🏆 Teams ({len(teams)}):")
-            for team in teams:
-                team_id = team.get('teamId', 'Unknown')
-                won = team.get('won', False)
-                rounds_won = team.get('roundsWon', 0)
-                rounds_played = team.get('roundsPlayed', 0)
-                num_points = team.get('numPoints', 0)
-                
-                print(f"  Team {team_id}: {'✅ Won' if won else '❌ Lost'}")
-                print(f"    Rounds: {rounds_won}/{rounds_played}")
-                print(f"    Points: {num_points}")
-                print()
+        api_key = next_api_key()
+    except RuntimeError as e:
+        logger.error("❌ %s", e)
+        return None
+    url = match_url(match_id, region)
+    
+    logger.debug("🧪 Testing Valorant API\n%s", "=" * 50)
+    logger.debug("🔍 Match ID: %s", match_id)
+    logger.debug("🌍 Region: %s", region)
+    logger.debug("📡 API URL: %s", url)
+    logger.debug("🔑 API Key: %s...\n%s", api_key[:10], "-" * 50)
+    
+    response = None
+    try:
+        # Use the cached copy when there is one, otherwise make the GET request
+        raw = read_cached_match(region, match_id)
+        if raw is not None:
+            logger.debug("💾 Loaded from cache: %s", cache_path(region, match_id))
+        else:
+            logger.debug("🚀 Sending GET request...")
+            response = request_match(url, api_key)
             
-            # Save the full response to a file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"match_data_{match_id}_{timestamp}.json"
+            logger.debug("📊 Status Code: %s", response.status_code)
+            logger.debug("⏱️  Response Time: %.2fs", response.elapsed.total_seconds())
+            logger.debug("📄 Content-Type: %s", response.headers.get('content-type', 'Unknown'))
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(match_data, f, indent=2, ensure_ascii=False)
+            if response.status_code != 200:
+                report_error(match_id, response.status_code, response)
+                return None
             
-            print(f"💾 Full match data saved to: {filename}")
+            # Without verbose output nothing reads the fields, so archive the raw body as is
+            if not verbose and not summary_only:
+                filename = stream_match(region, match_id, response, tag)
+                logger.info("✅ %s: saved to %s", match_id, filename)
+                return filename
             
-        elif response.status_code == 404:
-            print("❌ Error: Match not found")
-            print("This could mean:")
-            print("  - The match ID is incorrect")
-            print("  - The match is not available in the specified region")
-            print("  - The match is too old or not accessible")
-        elif response.status_code == 401:
-            print("❌ Error: Unauthorized")
-            print("Check your API key")
-        elif response.status_code == 403:
-            print("❌ Error: Forbidden")
-            print("API key may be invalid or expired")
-        elif response.status_code == 429:
-            print("❌ Error: Rate limit exceeded")
-            print("Try again later")
+            raw = response.content
+            write_cached_match(region, match_id, raw)
+        
+        # Summaries are printed from the cached copy; no output file is written
+        if summary_only:
+            summarize_match(raw, summary_only=True)
+            return str(cache_path(region, match_id))
+        
+        # Save the full response to a file
+        filename = save_raw_match(match_id, raw, tag)
+        
+        if verbose:
+            summarize_match(raw)
+            logger.info("💾 Full match data saved to: %s", filename)
         else:
-            print(f"❌ Error: {response.status_code}")
-            print(f"Response: {response.text}")
-            
+            logger.info("✅ %s: saved to %s", match_id, filename)
+        return filename
+        
     except requests.exceptions.ConnectionError:
-        print("❌ Connection Error: Check your internet connection")
+        logger.error("❌ %s: Connection Error: Check your internet connection", match_id)
     except requests.exceptions.Timeout:
-        print("❌ Timeout Error: Request took too long")
-    except json.JSONDecodeError:
-        print("❌ JSON Decode Error: Invalid response format")
-        print(f"Response: {response.text}")
+        logger.error("❌ %s: Timeout Error: Request took too long", match_id)
+    except msgspec.DecodeError:
+        logger.error("❌ %s: JSON Decode Error: Invalid response format", match_id)
+        if response is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response: %r", response.content[:500])
     except Exception as e:
-        print(f"❌ Unexpected Error: {str(e)}")
+        logger.error("❌ %s: Unexpected Error: %s", match_id, e)
+    finally:
+        if response is not None:
+            response.close()
+    return None
+
+async def fetch_match(client, match_id, region, sem):
+    """Fetch one match, returning its status code and raw JSON bytes (None unless 200)"""
+    key = (region.lower(), match_id)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_match(client, match_id, region, sem))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await task
+
+async def _fetch_match(client, match_id, region, sem):
+    """Fetch one match from the cache or the API"""
+    raw = read_cached_match(region, match_id)
+    if raw is not None:
+        return 200, raw
+    
+    api_key = next_api_key()
+    async with sem:
+        await asyncio.sleep(throttle_delay(api_key))
+        response = await get_with_retry_async(
+            client, match_url(match_id, region), headers={"X-Riot-Token": api_key}
+        )
+    
+    if response.status_code != 200:
+        return response.status_code, None
+    write_cached_match(region, match_id, response.content)
+    return response.status_code, response.content
+
+async def fetch_matches_batch(match_ids, region=REGION):
+    """Fetch several matches concurrently and save each one"""
+    logger.info("🧪 Fetching %d matches from the Valorant API\n%s", len(match_ids), "=" * 50)
+    
+    sem = asyncio.Semaphore(MAX_CONCURRENT)
+    # HTTP/2 multiplexes the concurrent requests over a few connections (falls back to HTTP/1.1 if not offered)
+    async with httpx.AsyncClient(
+        headers=HEADERS,
+        http2=True,
+        timeout=httpx.Timeout(15.0, connect=3.05),
+        limits=httpx.Limits(max_keepalive_connections=5, max_connections=20)
+    ) as client:
+        results = await asyncio.gather(
+            *[fetch_match(client, match_id, region, sem) for match_id in match_ids],
+            return_exceptions=True
+        )
+    
+    tag = run_tag()
+    for match_id, result in zip(match_ids, results):
+        if isinstance(result, Exception):
+            logger.error("❌ %s: %s: %s", match_id, type(result).__name__, result)
+            continue
+        
+        status_code, raw = result
+        if raw is None:
+            logger.error("❌ %s: HTTP %s", match_id, status_code)
+            continue
+        
+        # Saved byte-for-byte like the sync path, so both modes write the same files
+        filename = save_raw_match(match_id, raw, tag)
+        players = _PLAYER_LIST_DECODER.decode(raw).players
+        logger.info("✅ %s: %d players, saved to %s", match_id, len(players), filename)
+
+def _init_worker(processes, level):
+    """Set up a pool worker: share the rate limits between processes and match the log level"""
+    global RATE_LIMITS
+    RATE_LIMITS = tuple((requests / processes, window) for requests, window in RATE_LIMITS)
+    _key_buckets.cache_clear()
+    
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logger.setLevel(level)
+
+def _fetch_in_worker(job):
+    """Fetch and save one match in a pool worker, using that process's own session"""
+    match_id, region, tag = job
+    return match_id, test_valorant_api(match_id, region, verbose=False, tag=tag)
+
+def fetch_matches_pool(match_ids, region=REGION, processes=None):
+    """Fetch matches across worker processes, returning (match_id, filename or None) pairs"""
+    processes = processes or os.cpu_count()
+    logger.info("🧪 Fetching %d matches with %d processes\n%s", len(match_ids), processes, "=" * 50)
+    
+    tag = run_tag()
+    jobs = [(match_id, region, tag) for match_id in dict.fromkeys(match_ids)]
+    with Pool(processes, initializer=_init_worker, initargs=(processes, logger.getEffectiveLevel())) as pool:
+        return list(pool.imap_unordered(_fetch_in_worker, jobs, chunksize=4))
+
+def main():
+    """Run the API test for the given match IDs"""
+    parser = argparse.ArgumentParser(description="Test the Valorant match API")
+    parser.add_argument("match_ids", nargs="*", default=[MATCH_ID], help="Match IDs to fetch")
+    parser.add_argument("--region", default=REGION, help="API region (default: %(default)s)")
+    parser.add_argument("--sync", action="store_true", help="Fetch matches one at a time")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print each match's details (with --sync)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only report failures")
+    parser.add_argument(
+        "--summary-only", action="store_true",
+        help="Print match info and teams without saving the match (fetches one at a time)"
+    )
+    parser.add_argument(
+        "--processes", type=int, default=None, metavar="N",
+        help="Fetch with N worker processes instead of asyncio (0 for one per CPU)"
+    )
+    args = parser.parse_args()
+    
+    # Plain messages on stdout; the level decides which lines are formatted at all.
+    # Only this script's logger is raised, so httpx/urllib3 stay at WARNING
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logger.setLevel(logging.WARNING if args.quiet else logging.DEBUG if args.verbose else logging.INFO)
+    
+    if not api_keys():
+        parser.error("set RIOT_API_KEYS (comma-separated) or RIOT_API_KEY")
+    
+    if args.sync or args.summary_only:
+        tag = run_tag()
+        for match_id in args.match_ids:
+            test_valorant_api(match_id, args.region, tag=tag, summary_only=args.summary_only)
+    elif args.processes is not None:
+        fetch_matches_pool(args.match_ids, args.region, args.processes)
+    else:
+        asyncio.run(fetch_matches_batch(args.match_ids, args.region))
 
 if __name__ == "__main__":
-    test_valorant_api() 
\ No newline at end of file
+    main() 
\ No newline at end of file